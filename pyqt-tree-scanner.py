@@ -203,16 +203,194 @@ if __name__ == '__main__':
     app.exec_()
 #!/opt/homebrew/bin/python3
 import os
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-import squarify
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QComboBox, QVBoxLayout, QWidget, QPushButton, QFileDialog
+import mmap
+import queue
+import threading
+import numpy as np
+from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QComboBox, QVBoxLayout, QWidget, QPushButton, QFileDialog, QProgressBar
 from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import Qt, QThread
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+try:
+    import liburing  # Optional: batched wipe writes through io_uring on Linux
+except ImportError:
+    liburing = None
+
+WIPE_CHUNK = 1 << 20  # 1 MiB reusable write buffer
+ZERO_CHUNK = memoryview(bytes(WIPE_CHUNK))  # Plaintext for the AES-CTR keystream
+URING_DEPTH = 64  # Chunks in flight per io_uring batch
+SCAN_DIR_BATCH = 32  # Directories handed to one scan task
+SCAN_PROGRESS_EVERY = 10000  # Files between progress signals from the scan thread
+TREEMAP_LABEL_LIMIT = 500  # Past this many tiles the labels are unreadable anyway
+
+
+def _walk(directory):
+    # One stat per file through DirEntry instead of os.walk plus getsize
+    # Like os.walk, a directory's own files come before anything in its subdirectories
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append((entry.path, entry.stat(follow_symlinks=False).st_size))
+                except OSError:
+                    continue  # Vanished or unreadable
+    except OSError:
+        return  # Unreadable directory; skipped, as os.walk does
+    yield from files
+    for subdir in subdirs:
+        yield from _walk(subdir)
+
+
+def squarify_layout(sizes, x, y, w, h):
+    # Squarified treemap (Bruls et al.); sizes must be positive and sorted descending
+    # Compiled with numba the first time a treemap is drawn
+    n = sizes.shape[0]
+    rx = np.empty(n)
+    ry = np.empty(n)
+    rw = np.empty(n)
+    rh = np.empty(n)
+    values = sizes * (w * h / sizes.sum())
+    start = 0
+    while start < n:
+        # Grow the row along the shorter side while it keeps the worst aspect ratio down
+        side = min(w, h)
+        row_sum = values[start]
+        worst = max(side * side / row_sum, row_sum / (side * side))
+        end = start + 1
+        while end < n:
+            new_sum = row_sum + values[end]
+            ratio = max(side * side * values[start] / (new_sum * new_sum),
+                        new_sum * new_sum / (side * side * values[end]))
+            if ratio > worst:
+                break
+            worst = ratio
+            row_sum = new_sum
+            end += 1
+
+        if w >= h:
+            width = row_sum / h
+            offset = y
+            for i in range(start, end):
+                rx[i] = x
+                ry[i] = offset
+                rw[i] = width
+                rh[i] = values[i] / width
+                offset += rh[i]
+            x += width
+            w -= width
+        else:
+            height = row_sum / w
+            offset = x
+            for i in range(start, end):
+                rx[i] = offset
+                ry[i] = y
+                rw[i] = values[i] / height
+                rh[i] = height
+                offset += rw[i]
+            y += height
+            h -= height
+        start = end
+    return rx, ry, rw, rh
+
+
+def _is_rotational(path):
+    # Linux only; anything we can't determine is treated as a spinning disk
+    dev = os.stat(path).st_dev
+    base = f'/sys/dev/block/{os.major(dev)}:{os.minor(dev)}'
+    for candidate in (base + '/queue/rotational', base + '/../queue/rotational'):  # Partitions use the parent's queue
+        try:
+            with open(candidate) as f:
+                return f.read().strip() == '1'
+        except OSError:
+            continue
+    return True
+
+
+class _QueuedStream:
+    # Feeds overwrite() chunks produced ahead of time on another thread
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def update(self, data):
+        return self.chunks.get()
+
+
+def _scan_dirs(directories):
+    # One level of each directory; subdirectories go back to the pool as new tasks
+    paths = []
+    sizes = []
+    parents = []  # The scanned directory string itself, shared by every file in it
+    subdirs = []
+    for directory in directories:
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        paths.append(entry.path)
+                        sizes.append(entry.stat(follow_symlinks=False).st_size)
+                        parents.append(directory)
+        except OSError:
+            continue  # Vanished or unreadable
+    return paths, sizes, parents, subdirs
+
+
+def _parallel_walk(directory, progress=None, stop=None):
+    # stat() releases the GIL, so a thread pool overlaps the syscall latency
+    paths = []
+    parents = []
+    sizes = np.empty(1024, dtype=np.int64)  # Grown by doubling, trimmed on return
+    count = 0
+    reported = 0
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        pending = {executor.submit(_scan_dirs, [directory])}
+        while pending:
+            if stop is not None and stop():
+                for future in pending:
+                    future.cancel()  # Directories already being read still finish
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found_paths, found_sizes, found_parents, subdirs = future.result()
+                paths.extend(found_paths)
+                parents.extend(found_parents)
+                if count + len(found_sizes) > len(sizes):
+                    sizes = np.resize(sizes, max(2 * len(sizes), count + len(found_sizes)))
+                sizes[count:count + len(found_sizes)] = found_sizes
+                count += len(found_sizes)
+                if progress is not None and count - reported >= SCAN_PROGRESS_EVERY:
+                    progress(count)
+                    reported = count
+                for i in range(0, len(subdirs), SCAN_DIR_BATCH):
+                    pending.add(executor.submit(_scan_dirs, subdirs[i:i + SCAN_DIR_BATCH]))
+    return paths, sizes[:count], parents
+
+
+class ScanThread(QThread):
+    finished_df = pyqtSignal(object)
+    progress = pyqtSignal(int)
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+
+    def run(self):
+        import pandas as pd
+        paths, sizes, parents = _parallel_walk(self.directory, self.progress.emit, self.isInterruptionRequested)
+        if self.isInterruptionRequested():
+            return
+        data = pd.DataFrame({'File': pd.array(paths, dtype='string[pyarrow]'), 'Size': sizes,
+                             'Dir': pd.array(parents, dtype='string[pyarrow]')})
+        self.finished_df.emit(data)
 
 
 class SecureDeleteThread(QThread):
@@ -221,51 +399,185 @@ class SecureDeleteThread(QThread):
         self.file_path = file_path
         self.method = method
         self.passes = passes
+        self.size = os.path.getsize(file_path)
 
     def run(self):
-        if self.method == 'zero':
-            self.zero_fill()
-        elif self.method == 'random':
-            self.random_fill()
-        elif self.method == 'dod':
-            self.dod_standard()
-        elif self.method == 'aes':
-            self.aes_wipe()
+        self.ring = None
+        if liburing is not None and self.method in ('zero', 'random', 'dod'):
+            self.setup_ring()
+        try:
+            if self.method == 'zero':
+                self.zero_fill()
+            elif self.method == 'random':
+                self.random_fill()
+            elif self.method == 'dod':
+                self.dod_standard()
+            elif self.method == 'aes':
+                self.aes_wipe()
+        finally:
+            if self.ring is not None:
+                liburing.io_uring_queue_exit(self.ring)
         os.remove(self.file_path)
 
+    def setup_ring(self):
+        # Fixed chunk buffers registered once so the kernel doesn't pin/unpin them per write
+        ring = liburing.Ring()
+        try:
+            liburing.io_uring_queue_init(URING_DEPTH, ring)
+        except OSError:
+            return  # io_uring unavailable (ENOSYS / disabled), use plain writes
+        self.uring_bufs = [bytearray(WIPE_CHUNK) for _ in range(URING_DEPTH)]
+        self.uring_iov = liburing.Iovec(self.uring_bufs)
+        try:
+            liburing.io_uring_register_buffers(ring, self.uring_iov)
+        except OSError:
+            liburing.io_uring_queue_exit(ring)
+            return
+        self.ring = ring
+        self.cqe = liburing.Cqe()
+
+    def keystream(self):
+        # AES-CTR over zeros is a userspace CSPRNG running on AES-NI; fresh key per call
+        key = os.urandom(32)
+        nonce = os.urandom(16)
+        return Cipher(algorithms.AES(key), modes.CTR(nonce), backend=default_backend()).encryptor()
+
+    def overwrite_uring(self, fd, stream=None):
+        # Submit up to URING_DEPTH chunk writes at once and reap them together
+        offset = 0
+        while offset < self.size:
+            count = 0
+            tails = []  # Keep partial-chunk copies alive until their write completes
+            while count < URING_DEPTH and offset < self.size:
+                n = min(WIPE_CHUNK, self.size - offset)
+                buf = self.uring_bufs[count]
+                # Registered buffers keep the previous pass's data, so a zero pass refills them too
+                buf[:n] = stream.update(ZERO_CHUNK[:n]) if stream is not None else ZERO_CHUNK[:n]
+                sqe = liburing.io_uring_get_sqe(self.ring)
+                if n == WIPE_CHUNK:
+                    liburing.io_uring_prep_write_fixed(sqe, fd, buf, count, offset)
+                else:
+                    tails.append(bytes(buf[:n]))
+                    liburing.io_uring_prep_write(sqe, fd, tails[-1], offset)
+                offset += n
+                count += 1
+            liburing.io_uring_submit_and_wait(self.ring, count)
+            for _ in range(count):
+                liburing.io_uring_wait_cqe(self.ring, self.cqe)
+                completed = self.cqe[0]
+                try:
+                    completed.res  # Raises for a failed write
+                finally:
+                    liburing.io_uring_cqe_seen(self.ring, completed)
+
+    def open_for_wipe(self):
+        # Wiped data is never read back, so keep it out of the page cache where possible.
+        # Registered io_uring buffers can't be page aligned, so O_DIRECT is only used without a ring.
+        if hasattr(os, 'O_DIRECT') and self.ring is None:
+            try:
+                return os.open(self.file_path, os.O_WRONLY | os.O_DIRECT | os.O_SYNC), True
+            except OSError:
+                pass  # Filesystem doesn't support O_DIRECT (e.g. tmpfs)
+        return os.open(self.file_path, os.O_WRONLY), False
+
+    def close_wipe(self, fd):
+        os.ftruncate(fd, self.size)  # O_DIRECT rounds the last write up to a whole block
+        os.close(fd)
+
+    def overwrite(self, fd, buf, stream=None, direct=False):
+        # One pass over the file in buffer-sized chunks, flushed to disk at the end
+        if self.ring is not None:
+            self.overwrite_uring(fd, stream)
+        else:
+            view = memoryview(buf)
+            offset = 0
+            while offset < self.size:
+                n = min(len(buf), self.size - offset)
+                if stream is not None:
+                    buf[:n] = stream.update(ZERO_CHUNK[:n])
+                if direct:
+                    n = -(-n // mmap.PAGESIZE) * mmap.PAGESIZE  # O_DIRECT writes whole blocks
+                offset += os.pwrite(fd, view[:n], offset)
+            view.release()
+        os.fsync(fd)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)  # Drop the now-clean pages
+
     def zero_fill(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
+        buf = mmap.mmap(-1, WIPE_CHUNK)  # Anonymous mmap is zeroed and page aligned for O_DIRECT
+        fd, direct = self.open_for_wipe()
+        try:
             for _ in range(self.passes):
-                f.seek(0)
-                f.write(b'\x00' * os.path.getsize(self.file_path))
+                self.overwrite(fd, buf, direct=direct)
+        finally:
+            self.close_wipe(fd)
 
     def random_fill(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
+        buf = mmap.mmap(-1, WIPE_CHUNK)
+        stream = self.keystream()
+        fd, direct = self.open_for_wipe()
+        try:
             for _ in range(self.passes):
-                f.seek(0)
-                f.write(os.urandom(os.path.getsize(self.file_path)))
+                self.overwrite(fd, buf, stream, direct)
+        finally:
+            self.close_wipe(fd)
+
+    def produce(self, chunks):
+        # One pass worth of keystream, chunked exactly as overwrite() consumes it
+        stream = self.keystream()
+        offset = 0
+        while offset < self.size:
+            n = min(WIPE_CHUNK, self.size - offset)
+            chunks.put(stream.update(ZERO_CHUNK[:n]))
+            offset += n
 
     def dod_standard(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
-            for _ in range(3):  # DoD 5220.22-M standard is 3 passes
-                f.seek(0)
-                f.write(os.urandom(os.path.getsize(self.file_path)))
+        buf = mmap.mmap(-1, WIPE_CHUNK)
+        fd, direct = self.open_for_wipe()
+        try:
+            if not _is_rotational(self.file_path):
+                # Flash remaps writes, so repeated passes add nothing: one random pass, then zeros
+                self.overwrite(fd, buf, self.keystream(), direct)
+                self.overwrite(fd, mmap.mmap(-1, WIPE_CHUNK), direct=direct)
+            else:
+                # Keystreams for the passes are generated on their own threads while earlier passes write
+                queues = [queue.Queue(maxsize=4) for _ in range(3)]  # DoD 5220.22-M standard is 3 passes
+                for chunks in queues:
+                    threading.Thread(target=self.produce, args=(chunks,), daemon=True).start()
+                for chunks in queues:
+                    self.overwrite(fd, buf, _QueuedStream(chunks), direct)
+        finally:
+            self.close_wipe(fd)
 
     def aes_wipe(self):
-        key = os.urandom(32)
-        iv = os.urandom(16)
-        cipher = Cipher(algorithms.AES(key), modes.CFB(iv), backend=default_backend())
-        encryptor = cipher.encryptor()
-        with open(self.file_path, "ba+", buffering=0) as f:
-            f.seek(0)
-            data = f.read()
-            encrypted_data = encryptor.update(data) + encryptor.finalize()
-            f.seek(0)
-            f.write(encrypted_data)
+        # Encrypt the file in place one chunk at a time; CTR output is the same length as its input
+        encryptor = self.keystream()
+        buf = bytearray(WIPE_CHUNK)
+        out = bytearray(WIPE_CHUNK + 15)  # update_into wants block_size - 1 bytes of slack
+        fd = os.open(self.file_path, os.O_RDWR)
+        try:
+            offset = 0
+            while offset < self.size:
+                n = os.preadv(fd, [buf], offset)
+                if not n:
+                    break
+                written = encryptor.update_into(memoryview(buf)[:n], out)
+                os.pwrite(fd, memoryview(out)[:written], offset)
+                offset += n
+            encryptor.finalize()
+            os.fsync(fd)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
 
 class ShredSpaceApp(QMainWindow):
     def __init__(self):
         super().__init__()
+        self._layout = None
+        self._tiles = None
+        self.data = None
+        self.scan_thread = None
         self.initUI()
         self.current_directory = None
 
@@ -327,9 +639,8 @@ class ShredSpaceApp(QMainWindow):
         self.load_button.clicked.connect(self.load_data)
         self.load_button.setGeometry(10, 50, 100, 30)
 
-        # Add matplotlib canvas
-        self.canvas = FigureCanvas(plt.figure())
-        self.setCentralWidget(self.canvas)
+        # Add matplotlib canvas once the window has painted; matplotlib is slow to import
+        QTimer.singleShot(0, self._init_canvas)
 
         # Add secure deletion options
         self.deletion_method = QComboBox(self)
@@ -350,50 +661,123 @@ class ShredSpaceApp(QMainWindow):
         self.delete_button = QPushButton('Secure Delete', self)
         self.delete_button.clicked.connect(self.secure_delete)
         self.delete_button.setGeometry(10, 130, 150, 30)
+
+        # Scan progress in the status bar
+        self.scan_progress = QProgressBar(self)
+        self.scan_progress.setMaximumWidth(200)
+        self.scan_progress.hide()
+        self.statusBar().addPermanentWidget(self.scan_progress)
+
+    def _init_canvas(self):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        self.canvas = FigureCanvas(plt.figure())
+        self.canvas.mpl_connect('button_press_event', self.on_treemap_click)
+        self.setCentralWidget(self.canvas)
+
     def load_data(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Directory")
         if directory:
             self.current_directory = directory
-            self.update_visualization()
+            self.data = None
+            self.start_scan()
 
     def update_visualization(self):
         if not self.current_directory:
             return
-
-        files = []
-        sizes = []
-        for root, dirs, files in os.walk(self.current_directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                sizes.append(os.path.getsize(file_path))
-                files.append(file_path)
-
-        data = pd.DataFrame({'File': files, 'Size': sizes})
-
+        if self.data is None:
+            if self.scan_thread is None:
+                self.start_scan()
+            return  # A running scan draws with whichever type is selected when it finishes
+
+        # Only the visualization type changed; redraw the tree already scanned
+        agg = self.data.groupby('Dir', sort=False, observed=True)['Size'].sum().reset_index()
+        self.draw_treemap(agg, 'Dir')
+
+    def start_scan(self):
+        # A superseded scan stops at its next directory batch; its frame is never emitted
+        if self.scan_thread is not None:
+            self.scan_thread.requestInterruption()
+            self.scan_thread.wait()
+
+        # Walk off the GUI thread; the treemap is drawn when the scan thread hands back its frame
+        self.scan_progress.setRange(0, 0)  # Busy indicator, the file count isn't known up front
+        self.scan_progress.show()
+        self.scan_thread = ScanThread(self.current_directory)
+        self.scan_thread.progress.connect(self.on_scan_progress)
+        self.scan_thread.finished_df.connect(self._on_scan_done)
+        self.scan_thread.start()
+
+    def on_scan_progress(self, count):
+        self.statusBar().showMessage(f"Scanned {count} files")
+
+    def _on_scan_done(self, data):
+        if self.sender() is not self.scan_thread:
+            return  # Queued from a superseded scan
+        self.scan_progress.hide()
+        self.statusBar().clearMessage()
+
+        # One tile per directory; clicking a tile drills down to its files
+        self.data = data
+        agg = data.groupby('Dir', sort=False, observed=True)['Size'].sum().reset_index()
+        self.draw_treemap(agg, 'Dir')
+
+    def draw_treemap(self, data, key):
         vis_type = self.visualization_type.currentText()
         if vis_type == "Matplotlib Treemap":
-            self.plot_matplotlib_treemap(data)
+            self.plot_matplotlib_treemap(data, key)
         elif vis_type == "Plotly Treemap":
-            self.plot_plotly_treemap(data)
+            self.plot_plotly_treemap(data, key)
+
+    def on_treemap_click(self, event):
+        if event.inaxes is None or self._tiles is None:
+            return
+        rx, ry, rw, rh, names, key = self._tiles
+        hit = np.flatnonzero((rx <= event.xdata) & (event.xdata < rx + rw) & (ry <= event.ydata) & (event.ydata < ry + rh))
+        if key == 'Dir' and len(hit):
+            self.draw_treemap(self.data[self.data['Dir'] == names[hit[0]]], 'File')
+
+    def plot_matplotlib_treemap(self, data, key='File'):
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import PatchCollection
+        from matplotlib.patches import Rectangle
+        if self._layout is None:
+            from numba import njit
+            self._layout = njit(cache=True)(squarify_layout)
 
-    def plot_matplotlib_treemap(self, data):
         plt.clf()
-        sizes = data['Size']
-        labels = data['File']
-        squarify.plot(sizes=sizes, label=labels, alpha=.8)
+        data = data[data['Size'] > 0].sort_values('Size', ascending=False)
+        if data.empty:
+            self.canvas.draw()
+            return
+        sizes = data['Size'].to_numpy().astype(np.float64, copy=False)
+        labels = data[key].tolist()
+        rx, ry, rw, rh = self._layout(sizes, 0.0, 0.0, 100.0, 100.0)
+        self._tiles = (rx, ry, rw, rh, labels, key)
+
+        # All tiles in one collection rather than one patch per file
+        ax = plt.gca()
+        tiles = [Rectangle((rx[i], ry[i]), rw[i], rh[i]) for i in range(len(rx))]
+        ax.add_collection(PatchCollection(tiles, alpha=.8, facecolor=plt.rcParams['axes.prop_cycle'].by_key()['color']))
+        if len(tiles) <= TREEMAP_LABEL_LIMIT:
+            for i, label in enumerate(labels):
+                ax.text(rx[i] + rw[i] / 2, ry[i] + rh[i] / 2, label, va='center', ha='center')
+        ax.set_xlim(0, 100)
+        ax.set_ylim(0, 100)
         plt.axis('off')
         self.canvas.draw()
 
-    def plot_plotly_treemap(self, data):
-        fig = px.treemap(data, path=['File'], values='Size')
+    def plot_plotly_treemap(self, data, key='File'):
+        import plotly.express as px
+        fig = px.treemap(data, path=[key], values='Size')
         fig.show()
 
     def toggle_dark_mode(self):
-        if self.styleSheet():
-            self.setStyleSheet("")
-        else:
+        # The stylesheet never changes at runtime, so read it from disk only once
+        if not hasattr(ShredSpaceApp, '_dark_qss'):
             with open("dark_mode.qss", "r") as file:
-                self.setStyleSheet(file.read())
+                ShredSpaceApp._dark_qss = file.read()
+        self.setStyleSheet(ShredSpaceApp._dark_qss if not self.styleSheet() else "")
 
     def filter_files(self):
         filter_text = self.file_type_filter.currentText()
@@ -426,167 +810,323 @@ class ShredSpaceApp(QMainWindow):
         passes = self.passes_spinbox.value()
 
         # For demonstration, we'll just delete the first file in the directory
-        for root, dirs, files in os.walk(self.current_directory):
-            if files:
-                file_path = os.path.join(root, files[0])
-                self.start_secure_delete(file_path, selected_method, passes)
-                break
+        first = next(_walk(self.current_directory), None)
+        if first:
+            self.start_secure_delete(first[0], selected_method, passes)
 
     def start_secure_delete(self, file_path, method, passes):
         self.secure_delete_thread = SecureDeleteThread(file_path, method, passes)
         self.secure_delete_thread.start()
 import os
+import mmap
+import tempfile
+import numpy as np
+from numba import njit
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import Rectangle
 import plotly.express as px
-import squarify
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QComboBox, QVBoxLayout, QWidget, QPushButton, QFileDialog
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import Qt
+import plotly.io as pio
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QComboBox, QCompleter, QDialog,
+                             QFileDialog, QLabel, QLineEdit, QPushButton, QTabWidget, QVBoxLayout)
+from PyQt5.QtGui import QIcon, QFontDatabase, QFont, QKeySequence
+from PyQt5.QtCore import Qt, QThread, QTimer, QSortFilterProxyModel, QUrl, pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.backends import default_backend
+try:
+    import ahocorasick  # Optional: C trie behind the filter combobox's type-ahead
+except ImportError:
+    ahocorasick = None
+try:
+    from PyQt5.QtWebEngineWidgets import QWebEngineView  # Optional: shows Plotly in-window instead of a browser
+except ImportError:
+    QWebEngineView = None
+
+TREEMAP_LABEL_MIN_AREA = 400  # px², smaller tiles stay unlabelled
+WIPE_CHUNK = 1 << 20  # 1 MiB per write
+ZERO_CHUNK = memoryview(bytes(WIPE_CHUNK))  # Zero pass data and keystream plaintext
+SCAN_BATCH = 4096  # (path, size) rows per progress signal
+SETHTML_LIMIT = 2 * 1024 * 1024  # QWebEngineView.setHtml silently drops content above 2 MB
+VIS_DEBOUNCE_MS = 150
+
+# Extension -> file-type category (0 = other), matched against file_type_filter
+EXT_CAT = {
+    '.jpg': 1, '.jpeg': 1, '.png': 1, '.gif': 1, '.bmp': 1, '.tif': 1, '.tiff': 1, '.webp': 1, '.heic': 1, '.svg': 1,
+    '.pdf': 2, '.doc': 2, '.docx': 2, '.txt': 2, '.rtf': 2, '.odt': 2, '.md': 2, '.pages': 2,
+    '.xls': 2, '.xlsx': 2, '.ppt': 2, '.pptx': 2, '.csv': 2
+}
+FILTER_CATEGORIES = {"Images": 1, "Documents": 2}
+FILTER_LABELS = ["All Files", "Images", "Documents"] + ['*' + ext for ext in sorted(EXT_CAT)]
+
+def _iter_files(path):
+    # One stat per entry: DirEntry caches it from the directory read
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return  # Unreadable directory; skipped, as os.walk does
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdir, size = entry.path, None
+                elif entry.is_file(follow_symlinks=False):
+                    subdir, size = None, entry.stat(follow_symlinks=False).st_size
+                else:
+                    continue
+            except OSError:
+                continue  # Vanished or unreadable
+            if subdir is not None:
+                yield from _iter_files(subdir)
+            else:
+                yield (entry.path, size, EXT_CAT.get(os.path.splitext(entry.name)[1].lower(), 0))
+
+@njit(cache=True)
+def squarify_nb(values, x, y, dx, dy, out_x, out_y, out_dx, out_dy):
+    # Squarified treemap over values sorted descending and already scaled to sum to dx * dy
+    n = values.shape[0]
+    start = 0
+    while start < n:
+        # Grow the row along the shorter side while the worst aspect ratio keeps improving
+        side = min(dx, dy)
+        row_sum = values[start]
+        worst = max(side * side / row_sum, row_sum / (side * side))
+        end = start + 1
+        while end < n:
+            new_sum = row_sum + values[end]
+            ratio = max(side * side * values[start] / (new_sum * new_sum),
+                        new_sum * new_sum / (side * side * values[end]))
+            if ratio > worst:
+                break
+            worst = ratio
+            row_sum = new_sum
+            end += 1
+
+        if dx >= dy:
+            width = row_sum / dy
+            offset = y
+            for i in range(start, end):
+                out_x[i] = x
+                out_y[i] = offset
+                out_dx[i] = width
+                out_dy[i] = values[i] / width
+                offset += out_dy[i]
+            x += width
+            dx -= width
+        else:
+            height = row_sum / dx
+            offset = x
+            for i in range(start, end):
+                out_x[i] = offset
+                out_y[i] = y
+                out_dx[i] = values[i] / height
+                out_dy[i] = height
+                offset += out_dx[i]
+            y += height
+            dy -= height
+        start = end
+
+class LayoutWarmupThread(QThread):
+    # Loads (or compiles) squarify_nb off the GUI thread so the first treemap doesn't stall
+    def run(self):
+        out = np.empty(2)
+        squarify_nb(np.ones(2), 0.0, 0.0, 1.0, 2.0, out, out.copy(), out.copy(), out.copy())
 
+class PrefixFilterProxyModel(QSortFilterProxyModel):
+    # Type-ahead over the combobox labels: one trie prefix lookup per keystroke, then a set test per row
+    def __init__(self, labels, parent=None):
+        super().__init__(parent)
+        self._labels = [label.lower() for label in labels]
+        self._trie = None
+        if ahocorasick is not None:
+            self._trie = ahocorasick.Automaton()
+            for label in self._labels:
+                self._trie.add_word(label, label)
+            self._trie.make_automaton()
+        self._matches = None
+
+    def set_query(self, text):
+        query = text.lower()
+        if not query:
+            self._matches = None
+        elif self._trie is not None:
+            self._matches = set(self._trie.keys(query))
+        else:
+            self._matches = {label for label in self._labels if label.startswith(query)}
+        self.invalidateFilter()
 
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.current_directory = None
+    def filterAcceptsRow(self, row, parent):
+        if self._matches is None:
+            return True
+        return self.sourceModel().index(row, 0, parent).data().lower() in self._matches
 
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
+class ScanThread(QThread):
+    progress = pyqtSignal(list)  # [(path, size, category), ...]
 
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
 
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
+    def run(self):
+        batch = []
+        for row in _iter_files(self.directory):
+            batch.append(row)
+            if len(batch) >= SCAN_BATCH:
+                if self.isInterruptionRequested():
+                    return
+                self.progress.emit(batch)
+                batch = []
+        self.progress.emit(batch)
+
+def _fadvise(fd, advice):
+    # advice is the os constant's name; posix_fadvise is missing on Windows and macOS
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
 
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
+class SecureDeleteThread(QThread):
+    def __init__(self, file_path, method, passes):
+        super().__init__()
+        self.file_path = file_path
+        self.method = method
+        self.passes = passes
 
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
+    def run(self):
+        # The path is resolved twice (open, unlink); every pass in between works on the fd
+        # O_SEQUENTIAL is the Windows equivalent of the sequential fadvise hint
+        fd = os.open(self.file_path, os.O_RDWR | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0))
+        try:
+            self.size = os.fstat(fd).st_size
+            _fadvise(fd, 'POSIX_FADV_SEQUENTIAL')
+            if self.method == 'zero':
+                self.zero_fill(fd)
+            elif self.method == 'random':
+                self.random_fill(fd)
+            elif self.method == 'dod':
+                self.dod_standard(fd)
+            elif self.method == 'aes':
+                self.aes_wipe(fd)
+            _fadvise(fd, 'POSIX_FADV_DONTNEED')  # Written junk is clean after fsync; drop it from the cache
+        finally:
+            os.close(fd)
+        os.unlink(self.file_path)
+
+    def overwrite(self, fd, stream=None):
+        # One pass over the file in WIPE_CHUNK writes, then fsync
+        os.lseek(fd, 0, os.SEEK_SET)
+        remaining = self.size
+        while remaining:
+            n = min(WIPE_CHUNK, remaining)
+            chunk = ZERO_CHUNK[:n] if stream is None else stream.update(ZERO_CHUNK[:n])
+            remaining -= os.write(fd, chunk)  # A short write just continues with fresh data
+        os.fsync(fd)
+
+    def zero_fill(self, fd):
+        for _ in range(self.passes):
+            self.overwrite(fd)
+
+    def keystream(self):
+        # AES-CTR over zeros is a userspace CSPRNG (CTR_DRBG style) running at AES-NI speed
+        key = os.urandom(32)
+        nonce = os.urandom(16)
+        return Cipher(algorithms.AES(key), modes.CTR(nonce), backend=default_backend()).encryptor()
 
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
+    def random_fill(self, fd, passes=None):
+        for _ in range(self.passes if passes is None else passes):
+            self.overwrite(fd, self.keystream())  # Fresh key per pass
 
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
+    def dod_standard(self, fd):
+        self.random_fill(fd, 3)  # DoD 5220.22-M standard is 3 passes
 
-        # Add visualization type selector
-        self.visualization_type = QComboBox(self)
-        self.visualization_type.addItem("Matplotlib Treemap")
-        self.visualization_type.addItem("Plotly Treemap")
-        self.visualization_type.currentIndexChanged.connect(self.update_visualization)
-        menubar.setCornerWidget(self.visualization_type, Qt.TopLeftCorner)
+    def aes_wipe(self, fd):
+        key = os.urandom(32)
+        nonce = os.urandom(16)
+        # CTR has no block-to-block dependency, so OpenSSL can pipeline AES-NI across blocks
+        cipher = Cipher(algorithms.AES(key), modes.CTR(nonce), backend=default_backend())
+        encryptor = cipher.encryptor()
+        if not self.size:
+            return  # Nothing to encrypt, and mmap refuses empty files
+        # Encrypt through a mapping: no read/write syscalls and no file-sized Python buffer.
+        # update_into needs block_size - 1 bytes of slack past the data, so each chunk goes
+        # through a cache-resident scratch buffer rather than straight back onto itself.
+        scratch = memoryview(bytearray(WIPE_CHUNK + 15))
+        with mmap.mmap(fd, self.size) as mm:
+            with memoryview(mm) as view:
+                pos = 0
+                while pos < self.size:
+                    n = min(WIPE_CHUNK, self.size - pos)
+                    written = encryptor.update_into(view[pos:pos + n], scratch)
+                    view[pos:pos + written] = scratch[:written]
+                    pos += written
+            encryptor.finalize()
+            mm.flush()
+        os.fsync(fd)
 
-        self.text_edit = QTextEdit(self)
-        self.setCentralWidget(self.text_edit)
+class ShortcutDialog(QDialog):
+    # Parsed once at import; the app starts from these and only re-parses fields the user edits
+    DEFAULT_SHORTCUTS = {
+        "Delete File": QKeySequence("Ctrl+D"),
+        "Secure Delete File": QKeySequence("Ctrl+S"),
+        "Open Search Bar": QKeySequence("Ctrl+F")
+    }
+
+    def __init__(self, parent=None, shortcuts=None):
+        super().__init__(parent)
+        self.setWindowTitle("Customize Shortcuts")
+        self.layout = QVBoxLayout(self)
 
-        # Add load data button
-        self.load_button = QPushButton('Load Data', self)
-        self.load_button.clicked.connect(self.load_data)
-        self.load_button.setGeometry(10, 50, 100, 30)
+        self.shortcut_labels = {}
+        self.shortcut_inputs = {}
+        self.current_shortcuts = shortcuts or self.DEFAULT_SHORTCUTS
 
-        # Add matplotlib canvas
-        self.canvas = FigureCanvas(plt.figure())
-        self.setCentralWidget(self.canvas)
-import os
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-import squarify
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QComboBox, QVBoxLayout, QWidget, QPushButton, QFileDialog
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import Qt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.current_directory = None
+        for action_name, sequence in self.current_shortcuts.items():
+            self.add_shortcut_input(action_name, sequence.toString())
 
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
+        self.save_button = QPushButton("Save", self)
+        self.save_button.clicked.connect(self.save_shortcuts)
+        self.layout.addWidget(self.save_button)
 
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
+    def add_shortcut_input(self, action_name, default_shortcut):
+        label = QLabel(action_name, self)
+        input_field = QLineEdit(default_shortcut, self)
+        self.layout.addWidget(label)
+        self.layout.addWidget(input_field)
+        self.shortcut_labels[action_name] = label
+        self.shortcut_inputs[action_name] = input_field
 
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
+    def save_shortcuts(self):
+        self.accept()
 
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
+    def get_shortcuts(self):
+        shortcuts = {}
+        for action, input_field in self.shortcut_inputs.items():
+            current = self.current_shortcuts[action]
+            text = input_field.text()
+            shortcuts[action] = current if text == current.toString() else QKeySequence(text)
+        return shortcuts
 
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import QDir, Qt
 class ShredSpaceApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.initUI()
+        self.shortcuts = dict(ShortcutDialog.DEFAULT_SHORTCUTS)
+        self.update_shortcuts()
 
     def initUI(self):
         self.setWindowTitle('ShredSpace - Advanced File Visualizer')
         self.setGeometry(100, 100, 1200, 800)
 
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
         # Create menu bar
         menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
+        self.help_menu = menubar.addMenu('Help')
 
         # Add 'User Manual' action with system icon
         user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
         user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
+        self.help_menu.addAction(user_manual_action)
 
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
+        # FontAwesome is only used by 'More Info'; load both the first time Help opens
+        self.help_menu.aboutToShow.connect(self.load_fontawesome)
 
         # Add Dark Mode toggle
         view_menu = menubar.addMenu('View')
@@ -594,12 +1134,30 @@ class ShredSpaceApp(QMainWindow):
         dark_mode_action.triggered.connect(self.toggle_dark_mode)
         view_menu.addAction(dark_mode_action)
 
-        # Add file type filter
+        # Add shortcut customization
+        settings_menu = menubar.addMenu('Settings')
+        customize_shortcuts_action = QAction('Customize Shortcuts', self)
+        customize_shortcuts_action.triggered.connect(self.open_shortcut_dialog)
+        settings_menu.addAction(customize_shortcuts_action)
+
+        # Combobox changes restart this timer so only the last one redraws
+        self._vis_timer = QTimer(self)
+        self._vis_timer.setSingleShot(True)
+        self._vis_timer.setInterval(VIS_DEBOUNCE_MS)
+        self._vis_timer.timeout.connect(self._do_update_visualization)
+
+        # Add file type filter: categories plus one entry per known extension, searchable by typing
         self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
+        self.file_type_filter.addItems(FILTER_LABELS)
+        self.file_type_filter.setEditable(True)
+        self.file_type_filter.setInsertPolicy(QComboBox.NoInsert)
+        self._filter_proxy = PrefixFilterProxyModel(FILTER_LABELS, self)
+        self._filter_proxy.setSourceModel(self.file_type_filter.model())
+        completer = QCompleter(self._filter_proxy, self)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)  # The proxy already filtered
+        self.file_type_filter.setCompleter(completer)
+        self.file_type_filter.lineEdit().textEdited.connect(self._filter_proxy.set_query)
+        self.file_type_filter.currentIndexChanged.connect(self.update_visualization)
         menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
 
         # Add visualization type selector
@@ -609,1343 +1167,71 @@ class ShredSpaceApp(QMainWindow):
         self.visualization_type.currentIndexChanged.connect(self.update_visualization)
         menubar.setCornerWidget(self.visualization_type, Qt.TopLeftCorner)
 
+        # Treemaps and the user manual share the central tab widget
+        self.canvas = FigureCanvas(plt.figure())
+        self.tabs = QTabWidget(self)
+        self.tabs.addTab(self.canvas, "Matplotlib")
+        self._webview = None
+        if QWebEngineView is not None:
+            self._webview = QWebEngineView(self)
+            self.tabs.addTab(self._webview, "Plotly")
+        self._plotly_file = None
         self.text_edit = QTextEdit(self)
-        self.setCentralWidget(self.text_edit)
+        self.tabs.addTab(self.text_edit, "User Manual")
+        self.setCentralWidget(self.tabs)
 
         # Add load data button
         self.load_button = QPushButton('Load Data', self)
         self.load_button.clicked.connect(self.load_data)
-        self.load_button.setGeometry(10, 50, 100, 30)
+        self.tabs.setCornerWidget(self.load_button, Qt.TopRightCorner)
 
-        # Add matplotlib canvas
-        self.canvas = FigureCanvas(plt.figure())
-        self.setCentralWidget(self.canvas)
-    def load_data(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Directory")
-        if directory:
-            self.current_directory = directory
-            self.update_visualization()
-
-    def update_visualization(self):
-        if not self.current_directory:
-            return
-
-        files = []
-        sizes = []
-        for root, dirs, files in os.walk(self.current_directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                sizes.append(os.path.getsize(file_path))
-                files.append(file_path)
-
-        data = pd.DataFrame({'File': files, 'Size': sizes})
-
-        vis_type = self.visualization_type.currentText()
-        if vis_type == "Matplotlib Treemap":
-            self.plot_matplotlib_treemap(data)
-        elif vis_type == "Plotly Treemap":
-            self.plot_plotly_treemap(data)
-
-    def plot_matplotlib_treemap(self, data):
-        plt.clf()
-        sizes = data['Size']
-        labels = data['File']
-        squarify.plot(sizes=sizes, label=labels, alpha=.8)
-        plt.axis('off')
-        self.canvas.draw()
-
-    def plot_plotly_treemap(self, data):
-        fig = px.treemap(data, path=['File'], values='Size')
-        fig.show()
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox, QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import Qt, QDir
-
-class ShortcutDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Customize Shortcuts")
-        self.layout = QVBoxLayout(self)
-
-        self.shortcut_labels = {}
-        self.shortcut_inputs = {}
-
-        self.add_shortcut_input("Delete File", "Ctrl+D")
-        self.add_shortcut_input("Secure Delete File", "Ctrl+S")
-        self.add_shortcut_input("Open Search Bar", "Ctrl+F")
-
-        self.save_button = QPushButton("Save", self)
-        self.save_button.clicked.connect(self.save_shortcuts)
-        self.layout.addWidget(self.save_button)
-
-    def add_shortcut_input(self, action_name, default_shortcut):
-        label = QLabel(action_name, self)
-        input_field = QLineEdit(default_shortcut, self)
-        self.layout.addWidget(label)
-        self.layout.addWidget(input_field)
-        self.shortcut_labels[action_name] = label
-        self.shortcut_inputs[action_name] = input_field
-
-    def save_shortcuts(self):
-        self.accept()
-
-    def get_shortcuts(self):
-        return {action: input_field.text() for action, input_field in self.shortcut_inputs.items()}
-
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import QDir, Qt
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
-
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.shortcuts = {
-            "Delete File": "Ctrl+D",
-            "Secure Delete File": "Ctrl+S",
-            "Open Search Bar": "Ctrl+F"
-        }
-        self.update_shortcuts()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
-
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-
-        # Add shortcut customization
-        settings_menu = menubar.addMenu('Settings')
-        customize_shortcuts_action = QAction('Customize Shortcuts', self)
-        customize_shortcuts_action.triggered.connect(self.open_shortcut_dialog)
-        settings_menu.addAction(customize_shortcuts_action)
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.shortcuts = {
-            "Delete File": "Ctrl+D",
-            "Secure Delete File": "Ctrl+S",
-            "Open Search Bar": "Ctrl+F"
-        }
-        self.update_shortcuts()
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
-
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-
-        # Add shortcut customization
-        settings_menu = menubar.addMenu('Settings')
-        customize_shortcuts_action = QAction('Customize Shortcuts', self)
-        customize_shortcuts_action.triggered.connect(self.open_shortcut_dialog)
-        settings_menu.addAction(customize_shortcuts_action)
-
-        self.text_edit = QTextEdit(self)
-        self.setCentralWidget(self.text_edit)
-    def toggle_dark_mode(self):
-        if self.styleSheet():
-            self.setStyleSheet("")
-        else:
-            with open("dark_mode.qss", "r") as file:
-                self.setStyleSheet(file.read())
-
-    def filter_files(self):
-        filter_text = self.file_type_filter.currentText()
-        # Implement file filtering logic here
-        if filter_text == "All Files":
-            # Show all files
-            pass
-        elif filter_text == "Images":
-            # Show only image files
-            pass
-        elif filter_text == "Documents":
-            # Show only document files
-            pass
-
-    def load_data(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Directory")
-        if directory:
-            self.current_directory = directory
-            self.update_visualization()
-
-    def update_visualization(self):
-        if not self.current_directory:
-            return
-
-        files = []
-        sizes = []
-        for root, dirs, files in os.walk(self.current_directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                sizes.append(os.path.getsize(file_path))
-                files.append(file_path)
-
-        data = pd.DataFrame({'File': files, 'Size': sizes})
-
-        vis_type = self.visualization_type.currentText()
-        if vis_type == "Matplotlib Treemap":
-            self.plot_matplotlib_treemap(data)
-        elif vis_type == "Plotly Treemap":
-            self.plot_plotly_treemap(data)
-
-    def plot_matplotlib_treemap(self, data):
-        plt.clf()
-        sizes = data['Size']
-        labels = data['File']
-        squarify.plot(sizes=sizes, label=labels, alpha=.8)
-        plt.axis('off')
-        self.canvas.draw()
-
-    def plot_plotly_treemap(self, data):
-        fig = px.treemap(data, path=['File'], values='Size')
-        fig.show()
-
-    def open_shortcut_dialog(self):
-        dialog = ShortcutDialog(self)
-        if dialog.exec_():
-            self.shortcuts = dialog.get_shortcuts()
-            self.update_shortcuts()
-
-    def update_shortcuts(self):
-        self.shortcut_actions = {
-            "Delete File": QAction(self),
-            "Secure Delete File": QAction(self),
-            "Open Search Bar": QAction(self)
-        }
-        for action_name, shortcut in self.shortcuts.items():
-            self.shortcut_actions[action_name].setShortcut(shortcut)
-            self.shortcut_actions[action_name].triggered.connect(getattr(self, action_name.replace(" ", "_").lower()))
-            self.addAction(self.shortcut_actions[action_name])
-
-    def delete_file(self):
-        print("Delete File action triggered")
-
-    def secure_delete_file(self):
-        print("Secure Delete File action triggered")
-
-    def open_search_bar(self):
-        print("Open Search Bar action triggered")
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox, QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import Qt, QDir
-
-class ShortcutDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Customize Shortcuts")
-        self.layout = QVBoxLayout(self)
-
-        self.shortcut_labels = {}
-        self.shortcut_inputs = {}
-
-        self.add_shortcut_input("Delete File", "Ctrl+D")
-        self.add_shortcut_input("Secure Delete File", "Ctrl+S")
-        self.add_shortcut_input("Open Search Bar", "Ctrl+F")
-
-        self.save_button = QPushButton("Save", self)
-        self.save_button.clicked.connect(self.save_shortcuts)
-        self.layout.addWidget(self.save_button)
-
-    def add_shortcut_input(self, action_name, default_shortcut):
-        label = QLabel(action_name, self)
-        input_field = QLineEdit(default_shortcut, self)
-        self.layout.addWidget(label)
-        self.layout.addWidget(input_field)
-        self.shortcut_labels[action_name] = label
-        self.shortcut_inputs[action_name] = input_field
-
-    def save_shortcuts(self):
-        self.accept()
-
-    def get_shortcuts(self):
-        return {action: input_field.text() for action, input_field in self.shortcut_inputs.items()}
-
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import QDir, Qt
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
-
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.shortcuts = {
-            "Delete File": "Ctrl+D",
-            "Secure Delete File": "Ctrl+S",
-            "Open Search Bar": "Ctrl+F"
-        }
-        self.update_shortcuts()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
-
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-
-        # Add shortcut customization
-        settings_menu = menubar.addMenu('Settings')
-        customize_shortcuts_action = QAction('Customize Shortcuts', self)
-        customize_shortcuts_action.triggered.connect(self.open_shortcut_dialog)
-        settings_menu.addAction(customize_shortcuts_action)
-
-        self.text_edit = QTextEdit(self)
-        self.setCentralWidget(self.text_edit)
-
-    def open_user_manual(self):
-        manual_path = os.path.join(os.path.dirname(__file__), 'user_manual.md')
-        if os.path.exists(manual_path):
-            with open(manual_path, 'r') as file:
-                content = file.read()
-                self.text_edit.setPlainText(content)
-        else:
-            QMessageBox.warning(self, "Error", "User manual not found.")
-
-    def toggle_dark_mode(self):
-        if self.styleSheet():
-            self.setStyleSheet("")
-        else:
-            with open("dark_mode.qss", "r") as file:
-                self.setStyleSheet(file.read())
-
-    def filter_files(self):
-        filter_text = self.file_type_filter.currentText()
-        # Implement file filtering logic here
-        if filter_text == "All Files":
-            # Show all files
-            pass
-        elif filter_text == "Images":
-            # Show only image files
-            pass
-        elif filter_text == "Documents":
-            # Show only document files
-            pass
-
-    def open_shortcut_dialog(self):
-        dialog = ShortcutDialog(self)
-        if dialog.exec_():
-            self.shortcuts = dialog.get_shortcuts()
-            self.update_shortcuts()
-
-    def update_shortcuts(self):
-        self.shortcut_actions = {
-            "Delete File": QAction(self),
-            "Secure Delete File": QAction(self),
-            "Open Search Bar": QAction(self)
-        }
-        for action_name, shortcut in self.shortcuts.items():
-            self.shortcut_actions[action_name].setShortcut(shortcut)
-            self.shortcut_actions[action_name].triggered.connect(getattr(self, action_name.replace(" ", "_").lower()))
-            self.addAction(self.shortcut_actions[action_name])
-
-    def delete_file(self):
-        print("Delete File action triggered")
-
-    def secure_delete_file(self):
-        print("Secure Delete File action triggered")
-
-    def open_search_bar(self):
-        print("Open Search Bar action triggered")
-    def toggle_dark_mode(self):
-        if self.styleSheet():
-            self.setStyleSheet("")
-        else:
-            with open("dark_mode.qss", "r") as file:
-                self.setStyleSheet(file.read())
-
-    def filter_files(self):
-        filter_text = self.file_type_filter.currentText()
-        # Implement file filtering logic here
-        if filter_text == "All Files":
-            # Show all files
-            pass
-        elif filter_text == "Images":
-            # Show only image files
-            pass
-        elif filter_text == "Documents":
-            # Show only document files
-            pass
-
-if __name__ == '__main__':
-    app = QApplication([])
-    window = ShredSpaceApp()
-    window.show()
-    app.exec_()
-import os
-import random
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
-
-class SecureDeleteThread(QThread):
-    def __init__(self, file_path, method, passes):
-        super().__init__()
-        self.file_path = file_path
-        self.method = method
-        self.passes = passes
-
-    def run(self):
-        if self.method == 'zero':
-            self.zero_fill()
-        elif self.method == 'random':
-            self.random_fill()
-        elif self.method == 'dod':
-            self.dod_standard()
-        elif self.method == 'aes':
-            self.aes_wipe()
-        os.remove(self.file_path)
-
-    def zero_fill(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
-            for _ in range(self.passes):
-                f.seek(0)
-                f.write(b'\x00' * os.path.getsize(self.file_path))
-
-    def random_fill(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
-            for _ in range(self.passes):
-                f.seek(0)
-                f.write(os.urandom(os.path.getsize(self.file_path)))
-
-    def dod_standard(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
-            for _ in range(3):  # DoD 5220.22-M standard is 3 passes
-                f.seek(0)
-                f.write(os.urandom(os.path.getsize(self.file_path)))
-
-    def aes_wipe(self):
-        key = os.urandom(32)
-        iv = os.urandom(16)
-        cipher = Cipher(algorithms.AES(key), modes.CFB(iv), backend=default_backend())
-        encryptor = cipher.encryptor()
-        with open(self.file_path, "ba+", buffering=0) as f:
-            f.seek(0)
-            data = f.read()
-            encrypted_data = encryptor.update(data) + encryptor.finalize()
-            f.seek(0)
-            f.write(encrypted_data)
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox, QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import Qt, QDir
-
-class ShortcutDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Customize Shortcuts")
-        self.layout = QVBoxLayout(self)
-
-        self.shortcut_labels = {}
-        self.shortcut_inputs = {}
-
-        self.add_shortcut_input("Delete File", "Ctrl+D")
-        self.add_shortcut_input("Secure Delete File", "Ctrl+S")
-        self.add_shortcut_input("Open Search Bar", "Ctrl+F")
-
-        self.save_button = QPushButton("Save", self)
-        self.save_button.clicked.connect(self.save_shortcuts)
-        self.layout.addWidget(self.save_button)
-
-    def add_shortcut_input(self, action_name, default_shortcut):
-        label = QLabel(action_name, self)
-        input_field = QLineEdit(default_shortcut, self)
-        self.layout.addWidget(label)
-        self.layout.addWidget(input_field)
-        self.shortcut_labels[action_name] = label
-        self.shortcut_inputs[action_name] = input_field
-
-    def save_shortcuts(self):
-        self.accept()
-
-    def get_shortcuts(self):
-        return {action: input_field.text() for action, input_field in self.shortcut_inputs.items()}
-
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-import os
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-import squarify
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QComboBox, QVBoxLayout, QWidget, QPushButton, QFileDialog
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import Qt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.current_directory = None
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import QDir, Qt
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
-
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-
-        # Add visualization type selector
-        self.visualization_type = QComboBox(self)
-        self.visualization_type.addItem("Matplotlib Treemap")
-        self.visualization_type.addItem("Plotly Treemap")
-        self.visualization_type.currentIndexChanged.connect(self.update_visualization)
-        menubar.setCornerWidget(self.visualization_type, Qt.TopLeftCorner)
-
-        self.text_edit = QTextEdit(self)
-        self.setCentralWidget(self.text_edit)
-
-        # Add load data button
-        self.load_button = QPushButton('Load Data', self)
-        self.load_button.clicked.connect(self.load_data)
-        self.load_button.setGeometry(10, 50, 100, 30)
-
-        # Add matplotlib canvas
-        self.canvas = FigureCanvas(plt.figure())
-        self.setCentralWidget(self.canvas)
-    def load_data(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Directory")
-        if directory:
-            self.current_directory = directory
-            self.update_visualization()
-
-    def update_visualization(self):
-        if not self.current_directory:
-            return
-
-        files = []
-        sizes = []
-        for root, dirs, files in os.walk(self.current_directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                sizes.append(os.path.getsize(file_path))
-                files.append(file_path)
-
-        data = pd.DataFrame({'File': files, 'Size': sizes})
-
-        vis_type = self.visualization_type.currentText()
-        if vis_type == "Matplotlib Treemap":
-            self.plot_matplotlib_treemap(data)
-        elif vis_type == "Plotly Treemap":
-            self.plot_plotly_treemap(data)
-
-    def plot_matplotlib_treemap(self, data):
-        plt.clf()
-        sizes = data['Size']
-        labels = data['File']
-        squarify.plot(sizes=sizes, label=labels, alpha=.8)
-        plt.axis('off')
-        self.canvas.draw()
-
-    def plot_plotly_treemap(self, data):
-        fig = px.treemap(data, path=['File'], values='Size')
-        fig.show()
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox, QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import Qt, QDir
-
-class ShortcutDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Customize Shortcuts")
-        self.layout = QVBoxLayout(self)
-
-        self.shortcut_labels = {}
-        self.shortcut_inputs = {}
-
-        self.add_shortcut_input("Delete File", "Ctrl+D")
-        self.add_shortcut_input("Secure Delete File", "Ctrl+S")
-        self.add_shortcut_input("Open Search Bar", "Ctrl+F")
-
-        self.save_button = QPushButton("Save", self)
-        self.save_button.clicked.connect(self.save_shortcuts)
-        self.layout.addWidget(self.save_button)
-
-    def add_shortcut_input(self, action_name, default_shortcut):
-        label = QLabel(action_name, self)
-        input_field = QLineEdit(default_shortcut, self)
-        self.layout.addWidget(label)
-        self.layout.addWidget(input_field)
-        self.shortcut_labels[action_name] = label
-        self.shortcut_inputs[action_name] = input_field
-
-    def save_shortcuts(self):
-        self.accept()
-
-    def get_shortcuts(self):
-        return {action: input_field.text() for action, input_field in self.shortcut_inputs.items()}
-
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import QDir, Qt
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
-
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.shortcuts = {
-            "Delete File": "Ctrl+D",
-            "Secure Delete File": "Ctrl+S",
-            "Open Search Bar": "Ctrl+F"
-        }
-        self.update_shortcuts()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
-
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-
-        # Add shortcut customization
-        settings_menu = menubar.addMenu('Settings')
-        customize_shortcuts_action = QAction('Customize Shortcuts', self)
-        customize_shortcuts_action.triggered.connect(self.open_shortcut_dialog)
-        settings_menu.addAction(customize_shortcuts_action)
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.shortcuts = {
-            "Delete File": "Ctrl+D",
-            "Secure Delete File": "Ctrl+S",
-            "Open Search Bar": "Ctrl+F"
-        }
-        self.update_shortcuts()
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
-
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-
-        # Add shortcut customization
-        settings_menu = menubar.addMenu('Settings')
-        customize_shortcuts_action = QAction('Customize Shortcuts', self)
-        customize_shortcuts_action.triggered.connect(self.open_shortcut_dialog)
-        settings_menu.addAction(customize_shortcuts_action)
-
-        self.text_edit = QTextEdit(self)
-        self.setCentralWidget(self.text_edit)
-    def toggle_dark_mode(self):
-        if self.styleSheet():
-            self.setStyleSheet("")
-        else:
-            with open("dark_mode.qss", "r") as file:
-                self.setStyleSheet(file.read())
-
-    def filter_files(self):
-        filter_text = self.file_type_filter.currentText()
-        # Implement file filtering logic here
-        if filter_text == "All Files":
-            # Show all files
-            pass
-        elif filter_text == "Images":
-            # Show only image files
-            pass
-        elif filter_text == "Documents":
-            # Show only document files
-            pass
-
-    def open_shortcut_dialog(self):
-        dialog = ShortcutDialog(self)
-        if dialog.exec_():
-            self.shortcuts = dialog.get_shortcuts()
-            self.update_shortcuts()
-
-    def update_shortcuts(self):
-        self.shortcut_actions = {
-            "Delete File": QAction(self),
-            "Secure Delete File": QAction(self),
-            "Open Search Bar": QAction(self)
-        }
-        for action_name, shortcut in self.shortcuts.items():
-            self.shortcut_actions[action_name].setShortcut(shortcut)
-            self.shortcut_actions[action_name].triggered.connect(getattr(self, action_name.replace(" ", "_").lower()))
-            self.addAction(self.shortcut_actions[action_name])
-
-    def delete_file(self):
-        print("Delete File action triggered")
-
-    def secure_delete_file(self):
-        print("Secure Delete File action triggered")
-
-    def open_search_bar(self):
-        print("Open Search Bar action triggered")
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox, QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import Qt, QDir
-
-class ShortcutDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Customize Shortcuts")
-        self.layout = QVBoxLayout(self)
-
-        self.shortcut_labels = {}
-        self.shortcut_inputs = {}
-
-        self.add_shortcut_input("Delete File", "Ctrl+D")
-        self.add_shortcut_input("Secure Delete File", "Ctrl+S")
-        self.add_shortcut_input("Open Search Bar", "Ctrl+F")
-
-        self.save_button = QPushButton("Save", self)
-        self.save_button.clicked.connect(self.save_shortcuts)
-        self.layout.addWidget(self.save_button)
-
-    def add_shortcut_input(self, action_name, default_shortcut):
-        label = QLabel(action_name, self)
-        input_field = QLineEdit(default_shortcut, self)
-        self.layout.addWidget(label)
-        self.layout.addWidget(input_field)
-        self.shortcut_labels[action_name] = label
-        self.shortcut_inputs[action_name] = input_field
-
-    def save_shortcuts(self):
-        self.accept()
-
-    def get_shortcuts(self):
-        return {action: input_field.text() for action, input_field in self.shortcut_inputs.items()}
-
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QTextEdit, QMessageBox, QMenu, QComboBox
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtCore import QDir, Qt
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-
-        # Load FontAwesome
-        font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
-        if font_id == -1:
-            print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
-
-        # Add 'More Info' action with FontAwesome icon
-        fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
-        fa_action = QAction(fa_icon + ' More Info', self)
-        fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
+        # One full-figure axes and one PatchCollection, reused across redraws
+        self.ax = self.canvas.figure.add_axes([0, 0, 1, 1])
+        self.ax.axis('off')
+        self._patch_collection = None
+        self._labels = []
+        self._warmup_thread = LayoutWarmupThread()
+        self._warmup_thread.start()
 
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.shortcuts = {
-            "Delete File": "Ctrl+D",
-            "Secure Delete File": "Ctrl+S",
-            "Open Search Bar": "Ctrl+F"
+        self.current_directory = None
+        self.data = None
+        self._filter_cache = {}  # filter label -> row mask over self.data
+        self._scan_thread = None
+        self._reset_scan_arrays()
+
+        # Shortcut actions are created and connected once; update_shortcuts only rebinds keys
+        self.shortcut_actions = {}
+        handlers = {
+            "Delete File": self.delete_file,
+            "Secure Delete File": self.secure_delete_file,
+            "Open Search Bar": self.open_search_bar
         }
-        self.update_shortcuts()
-
-    def initUI(self):
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
+        for action_name, handler in handlers.items():
+            action = QAction(self)
+            action.triggered.connect(handler)
+            self.addAction(action)
+            self.shortcut_actions[action_name] = action
+
+        # Read the dark stylesheet once; toggling just swaps the cached string
+        self._dark_qss = ""
+        if os.path.exists("dark_mode.qss"):
+            with open("dark_mode.qss", "r") as file:
+                self._dark_qss = file.read()
 
-        # Load FontAwesome
+    def load_fontawesome(self):
+        self.help_menu.aboutToShow.disconnect(self.load_fontawesome)
         font_id = QFontDatabase.addApplicationFont("icons/fontawesome/fontawesome-webfont.ttf")
         if font_id == -1:
             print("Failed to load FontAwesome font.")
-        else:
-            fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.fa_font = QFont(fontawesome)
-
-        # Create menu bar
-        menubar = self.menuBar()
-        help_menu = menubar.addMenu('Help')
-
-        # Add 'User Manual' action with system icon
-        user_manual_action = QAction(QIcon.fromTheme('help-contents'), 'User Manual', self)
-        user_manual_action.triggered.connect(self.open_user_manual)
-        help_menu.addAction(user_manual_action)
+            return
+        fontawesome = QFontDatabase.applicationFontFamilies(font_id)[0]
+        self.fa_font = QFont(fontawesome)
 
         # Add 'More Info' action with FontAwesome icon
         fa_icon = chr(0xf05a)  # FontAwesome unicode for 'info-circle'
         fa_action = QAction(fa_icon + ' More Info', self)
         fa_action.setFont(self.fa_font)
-        help_menu.addAction(fa_action)
-
-        # Add Dark Mode toggle
-        view_menu = menubar.addMenu('View')
-        dark_mode_action = QAction('Toggle Dark Mode', self)
-        dark_mode_action.triggered.connect(self.toggle_dark_mode)
-        view_menu.addAction(dark_mode_action)
-
-        # Add file type filter
-        self.file_type_filter = QComboBox(self)
-        self.file_type_filter.addItem("All Files")
-        self.file_type_filter.addItem("Images")
-        self.file_type_filter.addItem("Documents")
-        self.file_type_filter.currentIndexChanged.connect(self.filter_files)
-        menubar.setCornerWidget(self.file_type_filter, Qt.TopRightCorner)
-
-        # Add shortcut customization
-        settings_menu = menubar.addMenu('Settings')
-        customize_shortcuts_action = QAction('Customize Shortcuts', self)
-        customize_shortcuts_action.triggered.connect(self.open_shortcut_dialog)
-        settings_menu.addAction(customize_shortcuts_action)
-
-        self.text_edit = QTextEdit(self)
-        self.setCentralWidget(self.text_edit)
+        self.help_menu.addAction(fa_action)
 
     def open_user_manual(self):
         manual_path = os.path.join(os.path.dirname(__file__), 'user_manual.md')
@@ -1953,45 +1239,175 @@ class ShredSpaceApp(QMainWindow):
             with open(manual_path, 'r') as file:
                 content = file.read()
                 self.text_edit.setPlainText(content)
+            self.tabs.setCurrentWidget(self.text_edit)
         else:
             QMessageBox.warning(self, "Error", "User manual not found.")
 
     def toggle_dark_mode(self):
-        if self.styleSheet():
-            self.setStyleSheet("")
-        else:
-            with open("dark_mode.qss", "r") as file:
-                self.setStyleSheet(file.read())
+        self.setStyleSheet("" if self.styleSheet() else self._dark_qss)
+
+    def load_data(self):
+        directory = QFileDialog.getExistingDirectory(self, "Select Directory")
+        if directory:
+            self.current_directory = directory
+            self.start_scan()
+
+    def start_scan(self):
+        # A superseded scan stops at its next batch; its queued signals are ignored below
+        if self._scan_thread is not None:
+            self._scan_thread.requestInterruption()
+            self._scan_thread.wait()
+        self._reset_scan_arrays()
+        self._scan_thread = ScanThread(self.current_directory)
+        self._scan_thread.progress.connect(self.on_scan_batch)
+        self._scan_thread.finished.connect(self.on_scan_finished)
+        self._scan_thread.start()
+
+    def _reset_scan_arrays(self):
+        self._scan_files = np.empty(1024, dtype=object)
+        self._scan_sizes = np.empty(1024, dtype=np.int64)
+        self._scan_cats = np.empty(1024, dtype=np.int8)
+        self._scan_count = 0
+
+    def on_scan_batch(self, batch):
+        if self.sender() is not self._scan_thread or not batch:
+            return
+        start = self._scan_count
+        end = start + len(batch)
+        if end > len(self._scan_sizes):
+            capacity = len(self._scan_sizes)
+            while capacity < end:
+                capacity *= 2
+            self._scan_files = np.resize(self._scan_files, capacity)
+            self._scan_sizes = np.resize(self._scan_sizes, capacity)
+            self._scan_cats = np.resize(self._scan_cats, capacity)
+        files, sizes, cats = zip(*batch)
+        self._scan_files[start:end] = files
+        self._scan_sizes[start:end] = sizes
+        self._scan_cats[start:end] = cats
+        self._scan_count = end
+
+    def on_scan_finished(self):
+        if self.sender() is not self._scan_thread or self._scan_thread.isInterruptionRequested():
+            return
+        self._scan_thread = None
+        n = self._scan_count
+        self.data = pd.DataFrame({'File': self._scan_files[:n], 'Size': self._scan_sizes[:n],
+                                  'Category': self._scan_cats[:n]}, copy=False)
+        self._filter_cache = {}
+        self._reset_scan_arrays()
+        self._do_update_visualization()
+
+    def update_visualization(self):
+        self._vis_timer.start()
+
+    def _do_update_visualization(self):
+        if self.data is None:
+            return
+
+        data = self.filter_files()
+        vis_type = self.visualization_type.currentText()
+        if vis_type == "Matplotlib Treemap":
+            self.plot_matplotlib_treemap(data)
+        elif vis_type == "Plotly Treemap":
+            self.plot_plotly_treemap(data)
 
     def filter_files(self):
-        filter_text = self.file_type_filter.currentText()
-        # Implement file filtering logic here
-        if filter_text == "All Files":
-            # Show all files
-            pass
-        elif filter_text == "Images":
-            # Show only image files
-            pass
-        elif filter_text == "Documents":
-            # Show only document files
-            pass
+        label = self.file_type_filter.currentText()
+        if label == "All Files" or label not in FILTER_LABELS:
+            return self.data
+        mask = self._filter_cache.get(label)
+        if mask is None:
+            cid = FILTER_CATEGORIES.get(label)
+            if cid is not None:
+                mask = self.data['Category'].to_numpy() == cid
+            else:
+                mask = self.data['File'].str.lower().str.endswith(label[1:]).to_numpy()  # '*.pdf' -> '.pdf'
+            self._filter_cache[label] = mask
+        return self.data[mask]
+
+    def plot_matplotlib_treemap(self, data):
+        sizes = data['Size'].to_numpy()
+        order = np.argsort(sizes)[::-1]
+        order = order[sizes[order] > 0]  # squarify wants positive sizes, largest first
+        sizes = sizes[order]
+        labels = data['File'].to_numpy()[order]
+        for text in self._labels:
+            text.remove()
+        self._labels = []
+        if not len(sizes):
+            if self._patch_collection is not None:
+                self._patch_collection.set_paths([])
+            self.canvas.draw_idle()
+            return
+
+        # Lay out in canvas pixels so the label threshold is a real on-screen area
+        dx, dy = float(max(self.canvas.width(), 1)), float(max(self.canvas.height(), 1))
+        n = len(sizes)
+        xs, ys, ws, hs = np.empty(n), np.empty(n), np.empty(n), np.empty(n)
+        squarify_nb(sizes * (dx * dy / sizes.sum()), 0.0, 0.0, dx, dy, xs, ys, ws, hs)
+        patches = [Rectangle((x, y), w, h) for x, y, w, h in zip(xs.tolist(), ys.tolist(), ws.tolist(), hs.tolist())]
+        if self._patch_collection is None:
+            self._patch_collection = PatchCollection(patches, match_original=False, alpha=.8, edgecolor='white')
+            self.ax.add_collection(self._patch_collection)
+        else:
+            self._patch_collection.set_paths(patches)
+        self._patch_collection.set_array(np.log1p(sizes))
+        self._patch_collection.autoscale()
+        self.ax.set_xlim(0, dx)
+        self.ax.set_ylim(0, dy)
+
+        for i in np.flatnonzero(ws * hs >= TREEMAP_LABEL_MIN_AREA):
+            self._labels.append(self.ax.text(xs[i] + ws[i] / 2, ys[i] + hs[i] / 2, os.path.basename(labels[i]),
+                                             ha='center', va='center', fontsize=7, clip_on=True))
+        self.tabs.setCurrentWidget(self.canvas)
+        self.canvas.draw_idle()
+
+    def plot_plotly_treemap(self, data):
+        fig = px.treemap(data, path=['File'], values='Size')
+        if self._webview is None:
+            fig.show()
+            return
+        html = pio.to_html(fig, include_plotlyjs='cdn', include_mathjax=False, config={'responsive': True})
+        if len(html) <= SETHTML_LIMIT:
+            self._webview.setHtml(html)
+        else:
+            # Too big for setHtml; reuse one temp file for every large refresh
+            if self._plotly_file is None:
+                fd, self._plotly_file = tempfile.mkstemp(suffix='.html', prefix='shredspace_')
+                os.close(fd)
+            with open(self._plotly_file, 'w', encoding='utf-8') as f:
+                f.write(html)
+            self._webview.load(QUrl.fromLocalFile(self._plotly_file))
+        self.tabs.setCurrentWidget(self._webview)
+
+    def closeEvent(self, event):
+        # The Plotly page is rewritten in place for the whole session; remove it on exit
+        if self._plotly_file is not None:
+            try:
+                os.remove(self._plotly_file)
+            except OSError:
+                pass
+        super().closeEvent(event)
 
     def open_shortcut_dialog(self):
-        dialog = ShortcutDialog(self)
+        dialog = ShortcutDialog(self, self.shortcuts)
         if dialog.exec_():
             self.shortcuts = dialog.get_shortcuts()
             self.update_shortcuts()
 
     def update_shortcuts(self):
-        self.shortcut_actions = {
-            "Delete File": QAction(self),
-            "Secure Delete File": QAction(self),
-            "Open Search Bar": QAction(self)
-        }
-        for action_name, shortcut in self.shortcuts.items():
-            self.shortcut_actions[action_name].setShortcut(shortcut)
-            self.shortcut_actions[action_name].triggered.connect(getattr(self, action_name.replace(" ", "_").lower()))
-            self.addAction(self.shortcut_actions[action_name])
+        # Apply every key in one pass so the menu bar re-lays out once
+        menubar = self.menuBar()
+        menubar.setUpdatesEnabled(False)
+        try:
+            for action_name, sequence in self.shortcuts.items():
+                action = self.shortcut_actions[action_name]
+                if action.shortcut() != sequence:
+                    action.setShortcut(sequence)
+        finally:
+            menubar.setUpdatesEnabled(True)
+            menubar.update()
 
     def delete_file(self):
         print("Delete File action triggered")
@@ -2001,25 +1417,6 @@ class ShredSpaceApp(QMainWindow):
 
     def open_search_bar(self):
         print("Open Search Bar action triggered")
-    def toggle_dark_mode(self):
-        if self.styleSheet():
-            self.setStyleSheet("")
-        else:
-            with open("dark_mode.qss", "r") as file:
-                self.setStyleSheet(file.read())
-
-    def filter_files(self):
-        filter_text = self.file_type_filter.currentText()
-        # Implement file filtering logic here
-        if filter_text == "All Files":
-            # Show all files
-            pass
-        elif filter_text == "Images":
-            # Show only image files
-            pass
-        elif filter_text == "Documents":
-            # Show only document files
-            pass
 
 if __name__ == '__main__':
     app = QApplication([])
@@ -2055,11 +1452,15 @@ class PaginatedListWidget(QWidget):
         self.update_display()
 
     def update_display(self):
-        self.list_widget.clear()
         start_index = self.current_page * self.items_per_page
         end_index = start_index + self.items_per_page
-        for item in self.items[start_index:end_index]:
-            self.list_widget.addItem(item)
+        # Swap the page in with one batch insert and a single repaint
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            self.list_widget.clear()
+            self.list_widget.addItems(self.items[start_index:end_index])
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
         self.prev_button.setEnabled(self.current_page > 0)
         self.next_button.setEnabled(end_index < len(self.items))
@@ -2074,23 +1475,28 @@ class PaginatedListWidget(QWidget):
 import os
 import sys
 import pandas as pd
-import matplotlib.pyplot as plt
 import squarify
 import plotly.express as px
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, 
-                             QFileDialog, QProgressBar, QLabel, QLineEdit, QMessageBox, QMenuBar, QMenu, QAction, QComboBox, QSlider, QListWidget)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+                             QFileDialog, QProgressBar, QLabel, QLineEdit, QMessageBox, QMenuBar, QMenu, QAction, QComboBox, QSlider, QListWidget,
+                             QGraphicsScene, QGraphicsView, QGraphicsRectItem)
+from PyQt5.QtGui import QBrush, QColor, QLinearGradient, QPainter, QPen
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 import shutil
 import numpy as np
 import json
-import matplotlib.patches as patches
-import random
+import functools
+import queue
+import threading
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 import cProfile
 import pstats
 
+WIPE_CHUNK = 1 << 20  # 1 MiB per write
+SEARCH_DEBOUNCE_MS = 150
+TREEMAP_WIDTH, TREEMAP_HEIGHT = 1000, 800  # Scene units; the view scales them to fit
+
 # Define theme colors globally
 theme_colors = {
     "Rainbow": ['#FFB554', '#FFA054', '#FF8054', '#FF5454', '#E64C8D', '#D145C1', '#8C3FC0', '#5240C3', '#4262C7', '#438CCB', '#46ACD3', '#45D2B0', '#4DC742', '#8CD466', '#C8E64C', '#FFFF54'],
@@ -2111,19 +1517,27 @@ class FileScannerThread(QThread):
     def run(self):
         file_sizes = []
         file_names = []
-        total_files = len([f for f in os.listdir(self.directory) if not f.startswith('.')])
-        increment = 100 / total_files if total_files > 0 else 1
-
-        for index, filename in enumerate(os.listdir(self.directory)):
-            if filename.startswith('.'):
-                continue  # Skip hidden files
-            path = os.path.join(self.directory, filename)
-            if os.path.isfile(path):
-                file_sizes.append(os.stat(path).st_size)
-                file_names.append(filename)
-            self.progress.emit(int((index + 1) * increment))
-
-        data = {'name': file_names, 'size': file_sizes}
+        file_mtimes = []
+        file_exts = []
+        # One directory read; DirEntry answers is_file/stat from it without re-resolving each path
+        with os.scandir(self.directory) as it:
+            entries = [entry for entry in it if not entry.name.startswith('.')]  # Skip hidden files
+        total_files = len(entries)
+
+        last_pct = -1
+        for index, entry in enumerate(entries):
+            if entry.is_file(follow_symlinks=False):
+                st = entry.stat(follow_symlinks=False)
+                file_sizes.append(st.st_size)
+                file_names.append(entry.name)
+                file_mtimes.append(st.st_mtime)
+                file_exts.append(os.path.splitext(entry.name)[1])
+            pct = (index + 1) * 100 // total_files
+            if pct != last_pct:  # At most 101 cross-thread signals, however many files
+                self.progress.emit(pct)
+                last_pct = pct
+
+        data = {'name': file_names, 'size': file_sizes, 'mtime': file_mtimes, 'ext': file_exts}
         df = pd.DataFrame(data)
         self.result.emit(df)
 
@@ -2146,74 +1560,141 @@ class SecureDeleteThread(QThread):
         os.remove(self.file_path)
 
     def zero_fill(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
-            for _ in range(self.passes):
-                f.seek(0)
-                f.write(b'\x00' * os.path.getsize(self.file_path))
-
-    def random_fill(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
+        size = os.path.getsize(self.file_path)
+        zeros = bytes(WIPE_CHUNK)
+        with open(self.file_path, "r+b") as f:
             for _ in range(self.passes):
                 f.seek(0)
-                f.write(os.urandom(os.path.getsize(self.file_path)))
+                remaining = size
+                while remaining:
+                    n = min(WIPE_CHUNK, remaining)
+                    f.write(zeros[:n] if n < WIPE_CHUNK else zeros)
+                    remaining -= n
+                f.flush()
+                os.fsync(f.fileno())  # Make each pass reach the disk instead of coalescing in the cache
+
+    def random_fill(self):
+        self._random_passes(self.passes)
 
     def dod_standard(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
-            for _ in range(3):  # DoD 5220.22-M standard is 3 passes
+        self._random_passes(3)  # DoD 5220.22-M standard is 3 passes
+
+    def _random_stream(self):
+        # AES-CTR over zeros: random-looking bytes at AES-NI speed instead of kernel CSPRNG reads
+        return Cipher(algorithms.AES(os.urandom(32)), modes.CTR(os.urandom(16)), backend=default_backend()).encryptor()
+
+    def _random_passes(self, passes):
+        size = os.path.getsize(self.file_path)
+        # Two rotating buffers: a producer thread fills one while this thread writes the other
+        free, filled = queue.Queue(), queue.Queue()
+        for _ in range(2):
+            free.put(bytearray(WIPE_CHUNK + 15))  # update_into needs block_size - 1 bytes of slack
+        producer = threading.Thread(target=self._produce_random, args=(size, passes, free, filled), daemon=True)
+        producer.start()
+        with open(self.file_path, "r+b") as f:
+            for _ in range(passes):
                 f.seek(0)
-                f.write(os.urandom(os.path.getsize(self.file_path)))
+                remaining = size
+                while remaining:
+                    item = filled.get()
+                    if isinstance(item, Exception):
+                        raise item
+                    buf, n = item
+                    f.write(memoryview(buf)[:n])
+                    free.put(buf)
+                    remaining -= n
+                f.flush()
+                os.fsync(f.fileno())
+        producer.join()
+
+    def _produce_random(self, size, passes, free, filled):
+        zero_chunk = bytes(WIPE_CHUNK)
+        try:
+            for _ in range(passes):
+                stream = self._random_stream()  # Fresh seed per pass
+                remaining = size
+                while remaining:
+                    n = min(WIPE_CHUNK, remaining)
+                    buf = free.get()
+                    stream.update_into(zero_chunk[:n] if n < WIPE_CHUNK else zero_chunk, buf)
+                    filled.put((buf, n))
+                    remaining -= n
+        except Exception as e:
+            filled.put(e)  # Wake the writer instead of leaving it blocked on get()
 
     def aes_wipe(self):
         key = os.urandom(32)
         iv = os.urandom(16)
-        cipher = Cipher(algorithms.AES(key), modes.CFB(iv), backend=default_backend())
+        cipher = Cipher(algorithms.AES(key), modes.CTR(iv), backend=default_backend())
         encryptor = cipher.encryptor()
-        with open(self.file_path, "ba+", buffering=0) as f:
-            f.seek(0)
-            data = f.read()
-            encrypted_data = encryptor.update(data) + encryptor.finalize()
-            f.seek(0)
-            f.write(encrypted_data)
-
-class ShredSpaceApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle('ShredSpace - Advanced File Visualizer')
-        self.setGeometry(100, 100, 1200, 800)
-        self.current_directory = None
-        self.selected_file = None
-        self.settings = self.load_settings()
-        self.initUI()
-
-    def compile_user_manual(self):
-        manual_directory = 'manuals'  # Directory containing markdown files
-        output_file_path = os.path.join(manual_directory, 'user_manual.md')  # Path to save the compiled manual
-
-        # Ensure the directory exists
-        if not os.path.exists(manual_directory):
-            os.makedirs(manual_directory)
-            QMessageBox.information(self, "Directory Missing", "The manuals directory does not exist and was created. Please add markdown files.")
-            return
+        # Encrypt in place a chunk at a time; CTR output is as long as its input
+        with open(self.file_path, "r+b") as f:
+            while True:
+                chunk = f.read(WIPE_CHUNK)
+                if not chunk:
+                    break
+                f.seek(-len(chunk), 1)
+                f.write(encryptor.update(chunk))
+            f.write(encryptor.finalize())
+            f.flush()
+            os.fsync(f.fileno())
 
-        # Read all markdown files and compile them into one
-        manual_files = [f for f in os.listdir(manual_directory) if f.endswith('.md')]
-        if not manual_files:
-            QMessageBox.information(self, "No Files Found", "No markdown files found in the manuals directory.")
-            return
+class TreemapView(QGraphicsView):
+    file_clicked = pyqtSignal(str)
 
-        with open(output_file_path, 'w') as outfile:
-            for fname in manual_files:
-                with open(os.path.join(manual_directory, fname), 'r') as infile:
-                    outfile.write(infile.read() + '\n\n')
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setScene(QGraphicsScene(0, 0, TREEMAP_WIDTH, TREEMAP_HEIGHT, self))  # Parented so it outlives this call
+        self.setRenderHint(QPainter.Antialiasing, False)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setBackgroundBrush(QBrush(Qt.white))
+
+    def show_rects(self, rects, names, labels, colors):
+        scene = self.scene()
+        scene.clear()
+        no_pen = QPen(Qt.NoPen)
+        for rect, name, label, color in zip(rects, names, labels, colors):
+            x, y, dx, dy = rect['x'], rect['y'], rect['dx'], rect['dy']
+            # Gradient lives in the brush, so each tile is a single fill
+            base = QColor(color)
+            base.setAlphaF(0.6)
+            gradient = QLinearGradient(x, y, x, y + dy)
+            gradient.setColorAt(0, base.lighter(130))
+            gradient.setColorAt(1, base)
+            item = QGraphicsRectItem(x, y, dx, dy)
+            item.setBrush(QBrush(gradient))
+            item.setPen(no_pen)
+            item.setData(0, name)
+            item.setToolTip(label)
+            scene.addItem(item)
+        self.fitInView(scene.sceneRect(), Qt.IgnoreAspectRatio)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.fitInView(self.scene().sceneRect(), Qt.IgnoreAspectRatio)
+
+    def mousePressEvent(self, event):
+        item = self.itemAt(event.pos())
+        if item is not None:
+            self.file_clicked.emit(item.data(0))
+        super().mousePressEvent(event)
 
-        QMessageBox.information(self, "User Manual Compiled", f"User manual has been compiled and saved as '{output_file_path}'.")
+class ShredSpaceApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle('ShredSpace - Advanced File Visualizer')
         self.setGeometry(100, 100, 1200, 800)
         self.current_directory = None
         self.selected_file = None
+        self.df = None
         self.settings = self.load_settings()
+        # Keystrokes restart this timer so a burst of typing runs one search
+        self._search_text = ''
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._do_search)
         self.initUI()
 
     def compile_user_manual(self):
@@ -2277,69 +1758,9 @@ class ShredSpaceApp(QMainWindow):
 
         main_layout.addLayout(toolbar_layout)
 
-        self.canvas = FigureCanvas(plt.figure(figsize=(10, 8)))
-        main_layout.addWidget(self.canvas)
-
-        container = QWidget()
-        container.setLayout(main_layout)
-        self.setCentralWidget(container)
-
-        self.create_menu()
-
-        self.toolbar = self.addToolBar('Main Toolbar')
-        delete_action = QAction(QIcon('delete.png'), 'Delete', self)
-        secure_delete_action = QAction(QIcon('secure_delete.png'), 'Secure Delete', self)
-        self.toolbar.addAction(delete_action)
-        self.toolbar.addAction(secure_delete_action)
-        delete_action.triggered.connect(self.delete_file)
-        secure_delete_action.triggered.connect(self.secure_delete_file)
-
-        self.search_bar = QLineEdit(self)
-        self.search_bar.textChanged.connect(self.update_search_results)
-        self.setCentralWidget(self.search_bar)
-
-        # Assuming you have a QListWidget or similar to display results
-        self.paginated_list = PaginatedListWidget([], parent=self)
-        self.setCentralWidget(self.paginated_list)
-        main_layout = QVBoxLayout()
-        toolbar_layout = QHBoxLayout()
-
-        self.load_button = QPushButton('Load Data')
-        self.load_button.clicked.connect(self.load_data)
-        toolbar_layout.addWidget(self.load_button)
-
-        self.search_var = QLineEdit()
-        self.search_var.textChanged.connect(self.update_search_results)
-        toolbar_layout.addWidget(self.search_var)
-
-        self.search_button = QPushButton('Search')
-        self.search_button.clicked.connect(self.search_files)
-        toolbar_layout.addWidget(self.search_button)
-
-        self.delete_button = QPushButton('Delete')
-        self.delete_button.clicked.connect(self.delete_file)
-        self.delete_button.setEnabled(False)
-        toolbar_layout.addWidget(self.delete_button)
-
-        self.secure_delete_button = QPushButton('Secure Delete')
-        self.secure_delete_button.clicked.connect(self.secure_delete_file)
-        self.secure_delete_button.setEnabled(False)
-        toolbar_layout.addWidget(self.secure_delete_button)
-
-        self.progress_bar = QProgressBar()
-        toolbar_layout.addWidget(self.progress_bar)
-
-        self.passes_slider = QSlider(Qt.Horizontal, self)
-        self.passes_slider.setMinimum(1)
-        self.passes_slider.setMaximum(99)
-        self.passes_slider.setValue(3)
-        self.passes_slider.valueChanged.connect(self.update_passes)
-        toolbar_layout.addWidget(self.passes_slider)
-
-        main_layout.addLayout(toolbar_layout)
-
-        self.canvas = FigureCanvas(plt.figure(figsize=(10, 8)))
-        main_layout.addWidget(self.canvas)
+        self.treemap_view = TreemapView(self)
+        self.treemap_view.file_clicked.connect(self.on_click)
+        main_layout.addWidget(self.treemap_view)
 
         container = QWidget()
         container.setLayout(main_layout)
@@ -2378,7 +1799,7 @@ class ShredSpaceApp(QMainWindow):
         for theme in theme_colors.keys():
             if theme != 'Monaco':
                 action = QAction(theme, self)
-                action.triggered.connect(lambda checked, theme=theme: self.set_color_theme(theme))
+                action.triggered.connect(functools.partial(self.set_color_theme, theme))
                 color_theme_menu.addAction(action)
 
         settings_menu.addSeparator()
@@ -2398,10 +1819,10 @@ class ShredSpaceApp(QMainWindow):
         sort_menu.addAction(sort_by_date_action)
 
         # Connect these actions to their respective functions
-        sort_by_name_action.triggered.connect(lambda: self.apply_sort('name'))
-        sort_by_size_action.triggered.connect(lambda: self.apply_sort('size'))
-        sort_by_type_action.triggered.connect(lambda: self.apply_sort('type'))
-        sort_by_date_action.triggered.connect(lambda: self.apply_sort('date'))
+        sort_by_name_action.triggered.connect(functools.partial(self.apply_sort, 'name'))
+        sort_by_size_action.triggered.connect(functools.partial(self.apply_sort, 'size'))
+        sort_by_type_action.triggered.connect(functools.partial(self.apply_sort, 'type'))
+        sort_by_date_action.triggered.connect(functools.partial(self.apply_sort, 'date'))
 
         recent_scans_menu = QMenu('Recent Scans', self)
         settings_menu.addMenu(recent_scans_menu)
@@ -2409,7 +1830,7 @@ class ShredSpaceApp(QMainWindow):
         self.recent_scans_actions = []
         for directory in self.settings.get('recent_scans', []):
             action = QAction(directory, self)
-            action.triggered.connect(lambda checked, dir=directory: self.load_recent_scan(dir))
+            action.triggered.connect(functools.partial(self.load_recent_scan, directory))
             recent_scans_menu.addAction(action)
             self.recent_scans_actions.append(action)
 
@@ -2454,63 +1875,37 @@ class ShredSpaceApp(QMainWindow):
         self.file_scanner_thread.start()
 
     def display_data(self, df):
+        self.df = df
         self.create_interactive_treemap(df, self.settings['color_theme'])
 
     def create_interactive_treemap(self, data, color_scheme):
-        plt.clf()
-        labels = [f"{name}\n{size} bytes" for name, size in zip(data['name'], data['size'])]
+        labels = (data['name'].astype(str) + '\n' + data['size'].astype(str) + ' bytes').tolist()
         sizes = data['size']
-        colors = [theme_colors[self.settings['color_theme']][int(i % len(theme_colors[self.settings['color_theme']]))] for i in range(len(data))]
-
-        fig, ax = plt.subplots()
-        squarify.plot(sizes=sizes, label=labels, color=colors, alpha=0.6, ax=ax, pad=False)
-        plt.axis('off')
-
-        # Apply gradient effect
-        for rect in ax.patches:
-            x, y, dx, dy = rect.get_x(), rect.get_y(), rect.get_width(), rect.get_height()
-            gradient_patch = patches.Rectangle((x, y), dx, dy, color='white', alpha=0.3)
-            ax.add_patch(gradient_patch)
-
-        self.canvas.figure = fig
-        self.canvas.draw()
+        # Cycle the palette with one index gather instead of a per-row dict lookup
+        palette = theme_colors[self.settings['color_theme']]
+        idx = np.arange(len(data)) % len(palette)
+        colors = np.asarray(palette, dtype=object)[idx].tolist()
 
-        # Connect the click event
-        self.canvas.mpl_connect('button_press_event', self.on_click)
+        # Layout only; drawing is done by Qt rather than matplotlib patches
+        values = squarify.normalize_sizes(sizes.tolist(), TREEMAP_WIDTH, TREEMAP_HEIGHT)
+        rects = squarify.squarify(values, 0, 0, TREEMAP_WIDTH, TREEMAP_HEIGHT)
+        self.treemap_view.show_rects(rects, data['name'].astype(str).tolist(), labels, colors)
 
     def apply_sort(self, sort_by):
-        if not self.current_directory:
+        if not self.current_directory or self.df is None:
             QMessageBox.information(self, "Error", "No directory selected.")
             return
 
-        files = os.listdir(self.current_directory)
-        if sort_by == 'name':
-            sorted_files = sorted(files)
-        elif sort_by == 'size':
-            sorted_files = sorted(files, key=lambda x: os.path.getsize(os.path.join(self.current_directory, x)))
-        elif sort_by == 'type':
-            sorted_files = sorted(files, key=lambda x: os.path.splitext(x)[1])
-        elif sort_by == 'date':
-            sorted_files = sorted(files, key=lambda x: os.path.getmtime(os.path.join(self.current_directory, x)))
+        # Sort the columns cached by the last scan; no filesystem calls per click
+        column = {'name': 'name', 'size': 'size', 'type': 'ext', 'date': 'mtime'}[sort_by]
+        self.display_data(self.df.sort_values(column, kind='mergesort'))
 
-        file_details = [(f, os.path.getsize(os.path.join(self.current_directory, f))) for f in sorted_files]
-        df = pd.DataFrame(file_details, columns=['name', 'size'])
-        self.display_data(df)
-
-    def on_click(self, event):
-        # Get the coordinates of the click
-        x, y = event.xdata, event.ydata
-        if x is not None and y is not None:
-            # Find the rectangle that was clicked
-            for rect in self.canvas.figure.axes[0].patches:
-                if rect.contains_point((x, y)):
-                    label = rect.get_label()
-                    file_name = label.split('\n')[0]
-                    self.selected_file = file_name
-                    self.delete_button.setEnabled(True)
-                    self.secure_delete_button.setEnabled(True)
-                    QMessageBox.information(self, "File Selected", f"Selected file: {file_name}")
-                    break
+    def on_click(self, file_name):
+        # The view resolves the clicked tile through its scene index
+        self.selected_file = file_name
+        self.delete_button.setEnabled(True)
+        self.secure_delete_button.setEnabled(True)
+        QMessageBox.information(self, "File Selected", f"Selected file: {file_name}")
 
     def get_selected_file(self):
         return self.selected_file if self.selected_file else None
@@ -2557,23 +1952,11 @@ class ShredSpaceApp(QMainWindow):
         return True
 
     def update_search_results(self, text):
-        if not text.strip():
-            self.clear_search_results()
-            return
-
-        # Assuming `self.file_list` contains all the filenames in the current directory
-        filtered_files = [filename for filename in self.file_list if text.lower() in filename.lower()]
-        self.display_search_results(filtered_files)
-
-    def display_search_results(self, filtered_files):
-        self.paginated_list.items = filtered_files
-        self.paginated_list.current_page = 0
-        self.paginated_list.update_display()
+        self._search_text = text
+        self._search_timer.start()
 
-    def clear_search_results(self):
-        self.paginated_list.items = []
-        self.paginated_list.current_page = 0
-        self.paginated_list.update_display()
+    def _do_search(self):
+        text = self._search_text
         if not text.strip():
             self.clear_search_results()
             return
@@ -2638,11 +2021,16 @@ import matplotlib.pyplot as plt
 import squarify
 import plotly.express as px
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, 
-                             QFileDialog, QProgressBar, QLabel, QLineEdit, QMessageBox, QMenuBar, QMenu, QAction, QComboBox, QSlider, QListWidget)
+                             QFileDialog, QProgressBar, QLabel, QLineEdit, QMessageBox, QMenuBar, QMenu, QAction, QComboBox, QSlider, QListWidget,
+                             QListView)
+from PyQt5.QtCore import QStringListModel
 class PaginatedListWidget(QWidget):
     def __init__(self, items, items_per_page=100, parent=None):
         super().__init__(parent)
-        self.list_widget = QListWidget(self)
+        # A string model swaps a page in as one list, with no per-row QListWidgetItem
+        self.model = QStringListModel(self)
+        self.view = QListView(self)
+        self.view.setModel(self.model)
         self.next_button = QPushButton("Next", self)
         self.prev_button = QPushButton("Previous", self)
         self.items = items
@@ -2650,7 +2038,7 @@ class PaginatedListWidget(QWidget):
         self.current_page = 0
 
         layout = QVBoxLayout(self)
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.view)
         layout.addWidget(self.prev_button)
         layout.addWidget(self.next_button)
 
@@ -2660,11 +2048,9 @@ class PaginatedListWidget(QWidget):
         self.update_display()
 
     def update_display(self):
-        self.list_widget.clear()
         start_index = self.current_page * self.items_per_page
         end_index = start_index + self.items_per_page
-        for item in self.items[start_index:end_index]:
-            self.list_widget.addItem(item)
+        self.model.setStringList(list(self.items[start_index:end_index]))
 
         self.prev_button.setEnabled(self.current_page > 0)
         self.next_button.setEnabled(end_index < len(self.items))
@@ -2676,6 +2062,19 @@ class PaginatedListWidget(QWidget):
     def previous_page(self):
         self.current_page -= 1
         self.update_display()
+
+    def count(self):
+        return self.model.rowCount()
+
+    def current_row(self):
+        return self.view.currentIndex().row()
+
+    def set_current_row(self, row):
+        self.view.setCurrentIndex(self.model.index(row))
+
+    def current_text(self):
+        index = self.view.currentIndex()
+        return index.data() if index.isValid() else None
 import os
 import sys
 import pandas as pd
@@ -2684,17 +2083,32 @@ import squarify
 import plotly.express as px
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, 
                              QFileDialog, QProgressBar, QLabel, QLineEdit, QMessageBox, QMenuBar, QMenu, QAction, QComboBox, QSlider, QListWidget)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import shutil
 import numpy as np
 import json
 import matplotlib.patches as patches
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
 import random
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 import cProfile
 import pstats
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import orjson  # Optional: faster settings.json round-trips
+except ImportError:
+    orjson = None
+
+SEARCH_DEBOUNCE_MS = 150
+SCAN_WORKERS = 8
+SCAN_CHUNK = 1024  # Directory entries stat'ed per worker task
+SAVE_DEBOUNCE_MS = 500
+WIPE_CHUNK = 4 << 20  # 4 MiB per read/write
+TREEMAP_WIDTH, TREEMAP_HEIGHT = 100, 100  # squarify.plot's default layout extent
+TREEMAP_LABEL_LIMIT = 200  # Above this, tiles are too small for readable text
 
 # Define theme colors globally
 theme_colors = {
@@ -2704,6 +2118,8 @@ theme_colors = {
     "Lagoon Nebula": ['#325086', '#9ED5AE', '#D86562', '#845D4E', '#F4AD6F', '#98C8D6', '#5A272C', '#CFAD4B'],
     "Monaco": ['#EC8921', '#DB4621', '#D92130', '#38B236', '#3DBFCC', '#2A91D2', '#7378D4']
 }
+# Parsed once so treemaps index RGBA rows instead of handing matplotlib hex strings per tile
+theme_rgba = {name: np.array([to_rgba(c) for c in palette], dtype=np.float32) for name, palette in theme_colors.items()}
 
 class FileScannerThread(QThread):
     progress = pyqtSignal(int)
@@ -2714,25 +2130,46 @@ class FileScannerThread(QThread):
         self.directory = directory
 
     def run(self):
-        file_sizes = []
-        file_names = []
-        total_files = len([f for f in os.listdir(self.directory) if not f.startswith('.')])
-        increment = 100 / total_files if total_files > 0 else 1
-
-        for index, filename in enumerate(os.listdir(self.directory)):
-            if filename.startswith('.'):
-                continue  # Skip hidden files
-            path = os.path.join(self.directory, filename)
-            if os.path.isfile(path):
-                file_sizes.append(os.stat(path).st_size)
-                file_names.append(filename)
-            self.progress.emit(int((index + 1) * increment))
-
-        data = {'name': file_names, 'size': file_sizes}
+        # One directory read; DirEntry answers is_file/stat without re-resolving each path
+        with os.scandir(self.directory) as it:
+            entries = [entry for entry in it if not entry.name.startswith('.')]  # Skip hidden files
+        total_files = len(entries)
+
+        # stat() releases the GIL, so worker threads keep several lookups in flight at once
+        chunks = [entries[i:i + SCAN_CHUNK] for i in range(0, total_files, SCAN_CHUNK)]
+        name_parts = [np.empty(0, dtype=object)]
+        size_parts = [np.empty(0, dtype=np.int64)]
+        done = 0
+        last_pct = -1
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            for chunk, (names, sizes) in zip(chunks, pool.map(self._scan_chunk, chunks)):
+                name_parts.append(names)
+                size_parts.append(sizes)
+                done += len(chunk)
+                pct = done * 100 // total_files
+                if pct != last_pct:  # At most 101 cross-thread signals, however many files
+                    self.progress.emit(pct)
+                    last_pct = pct
+
+        data = {'name': np.concatenate(name_parts), 'size': np.concatenate(size_parts)}
         df = pd.DataFrame(data)
         self.result.emit(df)
 
+    def _scan_chunk(self, entries):
+        # Sized for every entry up front and trimmed to the files found, so no per-file appends
+        sizes = np.empty(len(entries), dtype=np.int64)
+        names = np.empty(len(entries), dtype=object)
+        count = 0
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                sizes[count] = entry.stat().st_size
+                names[count] = entry.name
+                count += 1
+        return names[:count], sizes[:count]
+
 class SecureDeleteThread(QThread):
+    progress = pyqtSignal(int)
+
     def __init__(self, file_path, method, passes):
         super().__init__()
         self.file_path = file_path
@@ -2751,34 +2188,55 @@ class SecureDeleteThread(QThread):
         os.remove(self.file_path)
 
     def zero_fill(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
-            for _ in range(self.passes):
-                f.seek(0)
-                f.write(b'\x00' * os.path.getsize(self.file_path))
+        zeros = memoryview(bytes(WIPE_CHUNK))  # Slicing a view reuses the buffer, even for the tail
+        self._overwrite_passes(self.passes, lambda n: zeros[:n])
 
     def random_fill(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
-            for _ in range(self.passes):
-                f.seek(0)
-                f.write(os.urandom(os.path.getsize(self.file_path)))
+        self._overwrite_passes(self.passes, os.urandom)
 
     def dod_standard(self):
-        with open(self.file_path, "ba+", buffering=0) as f:
-            for _ in range(3):  # DoD 5220.22-M standard is 3 passes
+        self._overwrite_passes(3, os.urandom)  # DoD 5220.22-M standard is 3 passes
+
+    def _overwrite_passes(self, passes, fill):
+        # Chunked writes keep memory at one chunk instead of one file-sized buffer per pass
+        size = os.path.getsize(self.file_path)
+        total = passes * size or 1
+        done = 0
+        with open(self.file_path, "r+b") as f:
+            for _ in range(passes):
                 f.seek(0)
-                f.write(os.urandom(os.path.getsize(self.file_path)))
+                remaining = size
+                while remaining:
+                    n = min(WIPE_CHUNK, remaining)
+                    f.write(fill(n))
+                    remaining -= n
+                    done += n
+                    self.progress.emit(done * 100 // total)
+                f.flush()
+                os.fsync(f.fileno())
 
     def aes_wipe(self):
         key = os.urandom(32)
         iv = os.urandom(16)
         cipher = Cipher(algorithms.AES(key), modes.CFB(iv), backend=default_backend())
         encryptor = cipher.encryptor()
-        with open(self.file_path, "ba+", buffering=0) as f:
-            f.seek(0)
-            data = f.read()
-            encrypted_data = encryptor.update(data) + encryptor.finalize()
-            f.seek(0)
-            f.write(encrypted_data)
+        size = os.path.getsize(self.file_path) or 1
+        buf = bytearray(WIPE_CHUNK)
+        view = memoryview(buf)
+        # Encrypt in place a chunk at a time; CFB output is as long as its input
+        with open(self.file_path, "r+b") as f:
+            offset = 0
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                f.seek(offset)
+                f.write(encryptor.update(view[:n]))
+                offset += n
+                self.progress.emit(offset * 100 // size)
+            f.write(encryptor.finalize())
+            f.flush()
+            os.fsync(f.fileno())
 
 class ShredSpaceApp(QMainWindow):
     def __init__(self):
@@ -2787,6 +2245,11 @@ class ShredSpaceApp(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         self.current_directory = None
         self.selected_file = None
+        self._names = np.array([], dtype=object)
+        self._names_lower = np.array([], dtype=str)
+        self._last_search = ''
+        self._bboxes = np.empty((0, 4))
+        self._names_for_hit = np.array([], dtype=object)
         self.settings = self.load_settings()
         self.initUI()
 
@@ -2817,12 +2280,25 @@ class ShredSpaceApp(QMainWindow):
         main_layout = QVBoxLayout()
         toolbar_layout = QHBoxLayout()
 
+        # Keystrokes restart this timer so a burst of typing runs one filter pass
+        self._pending_search = ''
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._do_search)
+
+        # Settings changes restart this timer so settings.json is written once they settle
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self.save_settings)
+
         self.load_button = QPushButton('Load Data')
         self.load_button.clicked.connect(self.load_data)
         toolbar_layout.addWidget(self.load_button)
 
         self.search_var = QLineEdit()
-        self.search_var.textChanged.connect(self.update_search_results)
+        self.search_var.textChanged.connect(self._queue_search)
         toolbar_layout.addWidget(self.search_var)
 
         self.search_button = QPushButton('Search')
@@ -2854,6 +2330,10 @@ class ShredSpaceApp(QMainWindow):
         self.canvas = FigureCanvas(plt.figure(figsize=(10, 8)))
         main_layout.addWidget(self.canvas)
 
+        # Assuming you have a QListWidget or similar to display results
+        self.paginated_list = PaginatedListWidget([], parent=self)
+        main_layout.addWidget(self.paginated_list)
+
         container = QWidget()
         container.setLayout(main_layout)
         self.setCentralWidget(container)
@@ -2868,14 +2348,6 @@ class ShredSpaceApp(QMainWindow):
         delete_action.triggered.connect(self.delete_file)
         secure_delete_action.triggered.connect(self.secure_delete_file)
 
-        self.search_bar = QLineEdit(self)
-        self.search_bar.textChanged.connect(self.update_search_results)
-        self.setCentralWidget(self.search_bar)
-
-        # Assuming you have a QListWidget or similar to display results
-        self.paginated_list = PaginatedListWidget([], parent=self)
-        self.setCentralWidget(self.paginated_list)
-
     def create_menu(self):
         menubar = self.menuBar()
         settings_menu = menubar.addMenu('Settings')
@@ -2928,18 +2400,30 @@ class ShredSpaceApp(QMainWindow):
 
     def load_settings(self):
         try:
-            with open('settings.json', 'r') as f:
-                return json.load(f)
+            with open('settings.json', 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data)
         except FileNotFoundError:
             return {'color_theme': 'Monaco', 'recent_scans': []}
 
     def save_settings(self):
-        with open('settings.json', 'w') as f:
-            json.dump(self.settings, f)
+        if orjson:
+            data = orjson.dumps(self.settings)
+        else:
+            data = json.dumps(self.settings, separators=(',', ':')).encode()
+        with open('settings.json', 'wb') as f:
+            f.write(data)
+
+    def closeEvent(self, event):
+        # Flush a save still waiting on the debounce timer
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_settings()
+        super().closeEvent(event)
 
     def set_color_theme(self, theme):
         self.settings['color_theme'] = theme
-        self.save_settings()
+        self._save_timer.start()
         if self.current_directory:
             self.load_data()
 
@@ -2956,7 +2440,7 @@ class ShredSpaceApp(QMainWindow):
                 self.settings['recent_scans'].insert(0, directory)
                 if len(self.settings['recent_scans']) > 30:
                     self.settings['recent_scans'].pop()
-                self.save_settings()
+                self._save_timer.start()
             self.scan_directory()
 
     def scan_directory(self):
@@ -2967,23 +2451,44 @@ class ShredSpaceApp(QMainWindow):
         self.file_scanner_thread.start()
 
     def display_data(self, df):
+        # Lower-case once per scan so each search is a single vectorized pass
+        self._names = df['name'].to_numpy()
+        self._names_lower = df['name'].str.lower().to_numpy(dtype=str)
+        self._last_search = ''
         self.create_interactive_treemap(df, self.settings['color_theme'])
 
     def create_interactive_treemap(self, data, color_scheme):
         plt.clf()
-        labels = [f"{name}\n{size} bytes" for name, size in zip(data['name'], data['size'])]
+        labels = None
+        if len(data) <= TREEMAP_LABEL_LIMIT:
+            labels = [f"{name}\n{size} bytes" for name, size in zip(data['name'], data['size'])]
         sizes = data['size']
-        colors = [theme_colors[self.settings['color_theme']][int(i % len(theme_colors[self.settings['color_theme']]))] for i in range(len(data))]
+        palette = theme_rgba[color_scheme]  # Resolved once by the caller
+        colors = palette[np.arange(len(data)) % len(palette)]
+
+        # Layout only; the tiles are drawn as one PolyCollection instead of a Rectangle artist each
+        values = squarify.normalize_sizes(sizes.tolist(), TREEMAP_WIDTH, TREEMAP_HEIGHT)
+        rects = squarify.squarify(values, 0, 0, TREEMAP_WIDTH, TREEMAP_HEIGHT)
+        bounds = np.array([(r['x'], r['y'], r['dx'], r['dy']) for r in rects], dtype=float).reshape(-1, 4)
+        x0, y0 = bounds[:, 0], bounds[:, 1]
+        x1, y1 = x0 + bounds[:, 2], y0 + bounds[:, 3]
+        verts = np.stack((np.column_stack((x0, y0)), np.column_stack((x1, y0)),
+                          np.column_stack((x1, y1)), np.column_stack((x0, y1))), axis=1)
 
         fig, ax = plt.subplots()
-        squarify.plot(sizes=sizes, label=labels, color=colors, alpha=0.6, ax=ax, pad=False)
+        ax.add_collection(PolyCollection(verts, facecolors=colors, edgecolors='none', alpha=0.6))
+        # Gradient effect reuses the same quads
+        ax.add_collection(PolyCollection(verts, facecolors='white', edgecolors='none', alpha=0.3))
+        if labels is not None:
+            for x, y, dx, dy, label in zip(x0, y0, bounds[:, 2], bounds[:, 3], labels):
+                ax.text(x + dx / 2, y + dy / 2, label, va='center', ha='center')
+        ax.set_xlim(0, TREEMAP_WIDTH)
+        ax.set_ylim(0, TREEMAP_HEIGHT)
         plt.axis('off')
 
-        # Apply gradient effect
-        for rect in ax.patches:
-            x, y, dx, dy = rect.get_x(), rect.get_y(), rect.get_width(), rect.get_height()
-            gradient_patch = patches.Rectangle((x, y), dx, dy, color='white', alpha=0.3)
-            ax.add_patch(gradient_patch)
+        # (x0, y0, x1, y1) per tile, parallel to the names, for vectorized hit-testing in on_click
+        self._bboxes = np.column_stack((bounds[:, :2], bounds[:, :2] + bounds[:, 2:]))
+        self._names_for_hit = data['name'].to_numpy()
 
         self.canvas.figure = fig
         self.canvas.draw()
@@ -2996,34 +2501,34 @@ class ShredSpaceApp(QMainWindow):
             QMessageBox.information(self, "Error", "No directory selected.")
             return
 
-        files = os.listdir(self.current_directory)
+        # One stat per entry, shared by the sort key and the size column
+        with os.scandir(self.current_directory) as it:
+            entries = [(entry.name, entry.stat()) for entry in it if entry.is_file()]
         if sort_by == 'name':
-            sorted_files = sorted(files)
+            entries.sort(key=lambda e: e[0])
         elif sort_by == 'size':
-            sorted_files = sorted(files, key=lambda x: os.path.getsize(os.path.join(self.current_directory, x)))
+            entries.sort(key=lambda e: e[1].st_size)
         elif sort_by == 'type':
-            sorted_files = sorted(files, key=lambda x: os.path.splitext(x)[1])
+            entries.sort(key=lambda e: os.path.splitext(e[0])[1])
         elif sort_by == 'date':
-            sorted_files = sorted(files, key=lambda x: os.path.getmtime(os.path.join(self.current_directory, x)))
+            entries.sort(key=lambda e: e[1].st_mtime)
 
-        file_details = [(f, os.path.getsize(os.path.join(self.current_directory, f))) for f in sorted_files]
-        df = pd.DataFrame(file_details, columns=['name', 'size'])
+        df = pd.DataFrame({'name': [name for name, _ in entries], 'size': [st.st_size for _, st in entries]})
         self.display_data(df)
 
     def on_click(self, event):
         # Get the coordinates of the click
         x, y = event.xdata, event.ydata
         if x is not None and y is not None:
-            # Find the rectangle that was clicked
-            for rect in self.canvas.figure.axes[0].patches:
-                if rect.contains_point((x, y)):
-                    label = rect.get_label()
-                    file_name = label.split('\n')[0]
-                    self.selected_file = file_name
-                    self.delete_button.setEnabled(True)
-                    self.secure_delete_button.setEnabled(True)
-                    QMessageBox.information(self, "File Selected", f"Selected file: {file_name}")
-                    break
+            # Find the rectangle that was clicked with one comparison over all tiles
+            b = self._bboxes
+            hits = np.flatnonzero((b[:, 0] <= x) & (x < b[:, 2]) & (b[:, 1] <= y) & (y < b[:, 3]))
+            if hits.size:
+                file_name = self._names_for_hit[hits[0]]
+                self.selected_file = file_name
+                self.delete_button.setEnabled(True)
+                self.secure_delete_button.setEnabled(True)
+                QMessageBox.information(self, "File Selected", f"Selected file: {file_name}")
 
     def get_selected_file(self):
         return self.selected_file if self.selected_file else None
@@ -3061,7 +2566,7 @@ class ShredSpaceApp(QMainWindow):
 
     def update_passes(self, value):
         self.settings['secure_delete_passes'] = value
-        self.save_settings()
+        self._save_timer.start()
 
     def validate_passes(self, passes):
         if not (1 <= passes <= 99):
@@ -3069,14 +2574,28 @@ class ShredSpaceApp(QMainWindow):
             return False
         return True
 
+    def _queue_search(self, text):
+        self._pending_search = text
+        self._search_timer.start()
+
+    def _do_search(self):
+        self.update_search_results(self._pending_search)
+
     def update_search_results(self, text):
         if not text.strip():
             self.clear_search_results()
             return
 
-        # Assuming `self.file_list` contains all the filenames in the current directory
-        filtered_files = [filename for filename in self.file_list if text.lower() in filename.lower()]
-        self.display_search_results(filtered_files)
+        needle = text.lower()
+        # Any name containing the new text also contains the previous one, so narrow the last result
+        if self._last_search and self._last_search in needle:
+            names, names_lower = self._last_names, self._last_names_lower
+        else:
+            names, names_lower = self._names, self._names_lower
+        mask = np.char.find(names_lower, needle) >= 0
+        self._last_search = needle
+        self._last_names, self._last_names_lower = names[mask], names_lower[mask]
+        self.display_search_results(self._last_names.tolist())
 
     def display_search_results(self, filtered_files):
         self.paginated_list.items = filtered_files
@@ -3090,31 +2609,30 @@ class ShredSpaceApp(QMainWindow):
 
     def search_files(self):
         search_term = self.search_box.text().lower()
-        filtered_data = self.data[self.data['name'].str.contains(search_term, case=False, na=False)]
+        filtered_data = self.data[self.data['name'].str.contains(search_term, case=False, regex=False, na=False)]
         
         if filtered_data.empty:
             QMessageBox.information(self, "No Results", f"No files found matching: {search_term}")
         else:
-            self.create_interactive_treemap(filtered_data, 'Rainbow')
+            self.create_interactive_treemap(filtered_data, self.settings['color_theme'])
         print("Search for:", search_term)
         pass
 
     def keyPressEvent(self, event):
-        if event.key() == Qt.Key_Down:
-            self.paginated_list.list_widget.setCurrentRow(
-                (self.paginated_list.list_widget.currentRow() + 1) % self.paginated_list.list_widget.count()
-            )
-        elif event.key() == Qt.Key_Up:
-            self.paginated_list.list_widget.setCurrentRow(
-                (self.paginated_list.list_widget.currentRow() - 1 + self.paginated_list.list_widget.count()) % self.paginated_list.list_widget.count()
-            )
-        elif event.key() == Qt.Key_Return or event.key() == Qt.Key_Enter:
+        key = event.key()
+        if key in (Qt.Key_Down, Qt.Key_Up):
+            pages = self.paginated_list
+            n = pages.count()
+            if not n:
+                return  # Nothing listed; avoid a modulo by zero
+            step = 1 if key == Qt.Key_Down else -1
+            pages.set_current_row((pages.current_row() + step) % n)
+        elif key == Qt.Key_Return or key == Qt.Key_Enter:
             self.select_file()
 
     def select_file(self):
-        selected_item = self.paginated_list.list_widget.currentItem()
-        if selected_item:
-            selected_file = selected_item.text()
+        selected_file = self.paginated_list.current_text()
+        if selected_file:
             QMessageBox.information(self, "File Selected", f"Selected file: {selected_file}")
 
     def setup_accessibility(self):
@@ -3155,50 +2673,6 @@ class ShredSpaceApp(QMainWindow):
         with open('documentation.html', 'w') as f:
             f.write(html_content)
 
-        # Compile a user manual from markdown files
-        def compile_user_manual(self):
-            manual_files = [f for f in os.listdir('manuals') if f.endswith('.md')]
-            with open('user_manual.md', 'w') as f:
-                for manual_file in manual_files:
-                    with open(os.path.join('manuals', manual_file), 'r') as mf:
-                        f.write(mf.read())
-                        f.write("\n\n")
-            QMessageBox.information(self, "User Manual", "User manual has been compiled and saved as 'user_manual.md'.")
-        import inspect
-        import markdown2
-        import os
-
-        docstrings = []
-        for name, obj in inspect.getmembers(self):
-            if inspect.isfunction(obj) or inspect.ismethod(obj):
-                docstring = inspect.getdoc(obj)
-                if docstring:
-                    docstrings.append(f"### {name}\n{docstring}\n")
-                else:
-                    docstrings.append(f"### {name}\nNo documentation available.\n")
-
-        # Convert docstrings to markdown
-        markdown_content = "# Auto-generated Documentation\n" + "\n".join(docstrings)
-        html_content = markdown2.markdown(markdown_content)
-
-        # Save markdown file
-        with open('documentation.md', 'w') as f:
-            f.write(markdown_content)
-
-        # Save HTML file
-        with open('documentation.html', 'w') as f:
-            f.write(html_content)
-
-        # Compile a user manual from markdown files
-        def compile_user_manual(self):
-            manual_files = [f for f in os.listdir('manuals') if f.endswith('.md')]
-            with open('user_manual.md', 'w') as f:
-                for manual_file in manual_files:
-                    with open(os.path.join('manuals', manual_file), 'r') as mf:
-                        f.write(mf.read())
-                        f.write("\n\n")
-            QMessageBox.information(self, "User Manual", "User manual has been compiled and saved as 'user_manual.md'.")
-
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     main_window = ShredSpaceApp()